@@ -2,7 +2,7 @@
 
 import logging
 import time
-from typing import Any, Dict
+from typing import Any, Dict, Optional, Tuple
 
 from mcp.types import TextContent, Tool
 
@@ -10,6 +10,7 @@ from ..core.storage import StorageManager
 from ..jartype.core_types import IndexArtifactResult, RegisteredSourceInfo
 from ..utils.artifact_utils import (
   get_registered_source_info,
+  invalidate,
   is_artifact_code_available,
 )
 from ..utils.source_extraction import (
@@ -143,10 +144,13 @@ async def _extract_source_to_code_directory(
   storage_manager: StorageManager, source_info: RegisteredSourceInfo
 ) -> None:
   """Extract source code to the code directory based on source type."""
+  coordinates: Optional[Tuple[str, str, str]] = None
+
   try:
     group_id = source_info["group_id"]
     artifact_id = source_info["artifact_id"]
     version = source_info["version"]
+    coordinates = (group_id, artifact_id, version)
     source_type = source_info["source_type"]
     local_path = source_info["local_path"]
 
@@ -213,6 +217,10 @@ async def _extract_source_to_code_directory(
   except Exception as e:
     logger.error(f"Source extraction failed: {e}")
     raise ExtractionFailedError(f"Failed to extract source: {str(e)}")
+  finally:
+    # The code directory changed (or was removed); drop cached state lookups
+    if coordinates is not None:
+      invalidate(*coordinates)
 
 
 # MCP Tool definition
@@ -15,6 +15,7 @@ from ..core.git_handler import (
 )
 from ..core.source_processor import SourceProcessor
 from ..core.storage import StorageManager
+from ..utils.artifact_utils import invalidate
 from ..utils.download_utils import download_file, validate_jar_file
 from ..utils.source_extraction import safe_copy_tree
 from ..utils.validation import validate_maven_coordinates, validate_uri_format
@@ -129,6 +130,9 @@ async def register_source(
     else:
       raise UnsupportedSourceTypeError(f"Unsupported URI type: {uri_type}")
 
+    # The artifact's files changed; drop cached state lookups
+    invalidate(group_id, artifact_id, version)
+
     # Auto-index if requested
     if auto_index:
       try:
@@ -211,7 +215,7 @@ async def _handle_local_jar_file(
     local_path = Path(parsed_info["path"])
     if not local_path.exists():
       raise ResourceNotFoundError(f"Local JAR file not found: {local_path}")
-    if not validate_jar_file(local_path):
+    if not validate_jar_file(local_path, deep=True):
       raise InvalidSourceError(f"Invalid JAR file: {local_path}")
 
     # Copy JAR to source-jar directory
@@ -246,7 +250,7 @@ async def _handle_remote_jar_file(
 
     try:
       download_file(url, target_path)
-      if not validate_jar_file(target_path):
+      if not validate_jar_file(target_path, deep=True):
         target_path.unlink()  # Clean up invalid file
         raise InvalidSourceError(f"Downloaded file is not a valid JAR file: {url}")
       logger.info(f"Downloaded JAR file to: {target_path}")
@@ -1,12 +1,89 @@
 """Maven artifact management utilities."""
 
+import copy
 import os
 import json
+import time
+from functools import lru_cache, wraps
 from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple, TypeVar
 
 from ..jartype.core_types import RegisteredSourceInfo
 from .validation import validate_maven_coordinates
 
+# Only successful validations are memoized; invalid coordinates raise on every call
+_validate_maven_coordinates_cached = lru_cache(maxsize=1024)(validate_maven_coordinates)
+
+# Seconds an artifact state lookup is reused. Writers in this process call
+# invalidate(), so the TTL only bounds staleness from changes made elsewhere.
+_STATE_TTL_SECONDS = 5.0
+_STATE_CACHE_SIZE = 1024
+
+_StateKey = Tuple[str, str, str, str]
+_state_caches: List[Dict[_StateKey, Tuple[float, Any]]] = []
+
+_T = TypeVar("_T")
+
+
+def _jar_indexer_home() -> str:
+  """Return the JAR indexer base directory from the environment or the default."""
+  return os.path.expanduser(os.environ.get("JAR_INDEXER_HOME", "~/.jar-indexer"))
+
+
+def _cached_state(
+  func: Callable[[str, str, str], _T],
+) -> Callable[[str, str, str], _T]:
+  """Memoize an artifact state lookup for _STATE_TTL_SECONDS.
+
+  Entries are keyed by coordinates and the current JAR indexer home, so
+  changing JAR_INDEXER_HOME never returns another home's state. Lookups that
+  raise (invalid coordinates) are not cached. Every caller gets a shallow
+  copy, so mutating a returned dict cannot change the cached value.
+
+  Args:
+    func: Lookup taking group ID, artifact ID and version
+
+  Returns:
+    Cached wrapper around func
+  """
+  entries: Dict[_StateKey, Tuple[float, Any]] = {}
+  _state_caches.append(entries)
+
+  @wraps(func)
+  def wrapper(group_id: str, artifact_id: str, version: str) -> _T:
+    key = (group_id, artifact_id, version, _jar_indexer_home())
+    now = time.monotonic()
+    cached = entries.get(key)
+    if cached is not None and now - cached[0] < _STATE_TTL_SECONDS:
+      return copy.copy(cached[1])
+
+    result = func(group_id, artifact_id, version)
+    if len(entries) >= _STATE_CACHE_SIZE:
+      entries.clear()
+    entries[key] = (now, result)
+    return copy.copy(result)
+
+  return wrapper
+
+
+def invalidate(group_id: str, artifact_id: str, version: str) -> None:
+  """Drop cached state lookups for an artifact after its files change.
+
+  Args:
+    group_id: Maven group ID
+    artifact_id: Maven artifact ID
+    version: Maven version
+  """
+  for entries in _state_caches:
+    for key in [k for k in entries if k[:3] == (group_id, artifact_id, version)]:
+      entries.pop(key, None)
+
+
+def clear_state_cache() -> None:
+  """Drop every cached state lookup, e.g. after JAR_INDEXER_HOME changes."""
+  for entries in _state_caches:
+    entries.clear()
+
 
 def get_artifact_code_path(group_id: str, artifact_id: str, version: str) -> str:
   """Convert Maven coordinates to artifact code directory path.
@@ -23,7 +100,7 @@ def get_artifact_code_path(group_id: str, artifact_id: str, version: str) -> str
     ValueError: If Maven coordinates are invalid
   """
   # Validate Maven coordinates
-  validate_maven_coordinates(group_id, artifact_id, version)
+  _validate_maven_coordinates_cached(group_id, artifact_id, version)
 
   # Convert group_id dots to path separators (org.springframework -> org/springframework)
   group_path = group_id.replace(".", "/")
@@ -34,6 +111,7 @@ def get_artifact_code_path(group_id: str, artifact_id: str, version: str) -> str
   return artifact_path
 
 
+@_cached_state
 def is_artifact_code_available(group_id: str, artifact_id: str, version: str) -> bool:
   """Check if artifact source code exists in code/ directory.
 
@@ -52,7 +130,7 @@ def is_artifact_code_available(group_id: str, artifact_id: str, version: str) ->
   artifact_path = get_artifact_code_path(group_id, artifact_id, version)
 
   # Get the base directory from environment or use default ~/.jar-indexer
-  base_dir = os.path.expanduser(os.environ.get("JAR_INDEXER_HOME", "~/.jar-indexer"))
+  base_dir = _jar_indexer_home()
   code_dir = os.path.join(base_dir, "code", artifact_path)
 
   # Check if the code directory exists and has content
@@ -71,6 +149,7 @@ def is_artifact_code_available(group_id: str, artifact_id: str, version: str) ->
     return False
 
 
+@_cached_state
 def is_artifact_code_indexed(group_id: str, artifact_id: str, version: str) -> bool:
   """Check if artifact is fully indexed (has .jar-indexer/index.json).
 
@@ -89,7 +168,7 @@ def is_artifact_code_indexed(group_id: str, artifact_id: str, version: str) -> b
   artifact_path = get_artifact_code_path(group_id, artifact_id, version)
 
   # Get the base directory from environment or use default ~/.jar-indexer
-  base_dir = os.path.expanduser(os.environ.get("JAR_INDEXER_HOME", "~/.jar-indexer"))
+  base_dir = _jar_indexer_home()
   code_dir = os.path.join(base_dir, "code", artifact_path)
 
   code_path = Path(code_dir)
@@ -112,6 +191,7 @@ def is_artifact_code_indexed(group_id: str, artifact_id: str, version: str) -> b
     return False
 
 
+@_cached_state
 def get_registered_source_info(
   group_id: str, artifact_id: str, version: str
 ) -> RegisteredSourceInfo | None:
@@ -132,7 +212,7 @@ def get_registered_source_info(
   artifact_path = get_artifact_code_path(group_id, artifact_id, version)
 
   # Get the base directory from environment or use default ~/.jar-indexer
-  base_dir = os.path.expanduser(os.environ.get("JAR_INDEXER_HOME", "~/.jar-indexer"))
+  base_dir = _jar_indexer_home()
   base_path = Path(base_dir)
 
   # Check different source types to determine what's registered
@@ -1,18 +1,61 @@
 """Download and validation utilities for JAR files."""
 
+import os
 import zipfile
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Iterable, Iterator, List, Optional
 from urllib.parse import urlparse
 import requests
+import urllib3
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
+# Local file header, empty archive and spanned archive signatures
+_ZIP_MAGIC = (b"PK\x03\x04", b"PK\x05\x06", b"PK\x07\x08")
+
+# Set to "1" to stream downloads through a shared urllib3 pool instead of a
+# per-call requests.Session
+URLLIB3_DOWNLOAD_ENV = "JAR_INDEXER_URLLIB3_DOWNLOAD"
+
+
+# PoolManager is thread-safe; every process (e.g. each xdist worker) gets its own
+@lru_cache(maxsize=1)
+def _get_pool() -> urllib3.PoolManager:
+  """Return the shared urllib3 connection pool, creating it lazily."""
+  return urllib3.PoolManager(maxsize=8)
+
+
+def _readinto_chunks(
+  raw: urllib3.BaseHTTPResponse, chunk_size: int
+) -> Iterator[memoryview]:
+  """Stream a urllib3 response through one reused buffer.
+
+  Each yielded view is only valid until the next one is produced.
+
+  Args:
+    raw: Unread urllib3 response
+    chunk_size: Size of the reused buffer in bytes
+
+  Yields:
+    Views of the buffer holding the bytes read so far
+  """
+  raw.decode_content = True
+  buffer = bytearray(chunk_size)
+  view = memoryview(buffer)
+  while True:
+    read = raw.readinto(buffer)
+    if not read:
+      return
+    yield view[:read]
+
 
 def download_file(
   url: str,
   target_path: Path,
-  chunk_size: int = 8192,
+  chunk_size: int = 256 * 1024,
   timeout: int = 30,
   max_retries: int = 3,
 ) -> Dict[str, Any]:
@@ -44,44 +87,80 @@ def download_file(
   if not target_path.parent.exists():
     raise ValueError(f"Target directory does not exist: {target_path.parent}")
 
-  # Set up session with retry strategy
-  session = requests.Session()
   retry_strategy = Retry(
     total=max_retries,
     backoff_factor=1,
     status_forcelist=[429, 500, 502, 503, 504],
     allowed_methods=["HEAD", "GET", "OPTIONS"],
   )
-  adapter = HTTPAdapter(max_retries=retry_strategy)
-  session.mount("http://", adapter)
-  session.mount("https://", adapter)
+  session: Optional[requests.Session] = None
+  pooled_response: Optional[urllib3.BaseHTTPResponse] = None
+  chunks: Iterable[Any]
 
   try:
-    response = session.get(url, stream=True, timeout=timeout)
-    response.raise_for_status()
+    if os.environ.get(URLLIB3_DOWNLOAD_ENV) == "1":
+      # Stream straight from urllib3, skipping requests' per-chunk overhead
+      pooled_response = _get_pool().request(
+        "GET",
+        url,
+        preload_content=False,
+        retries=retry_strategy,
+        timeout=urllib3.Timeout(connect=timeout, read=timeout),
+      )
+      if pooled_response.status >= 400:
+        raise requests.HTTPError(f"{pooled_response.status} Error for url: {url}")
+      headers = pooled_response.headers
+      chunks = _readinto_chunks(pooled_response, chunk_size)
+    else:
+      # Set up session with retry strategy
+      session = requests.Session()
+      adapter = HTTPAdapter(max_retries=retry_strategy)
+      session.mount("http://", adapter)
+      session.mount("https://", adapter)
+
+      response = session.get(url, stream=True, timeout=timeout)
+      response.raise_for_status()
+      headers = response.headers
+      # Read straight from urllib3 when possible; iter_content allocates a new
+      # bytes object per chunk
+      raw = getattr(response, "raw", None)
+      if isinstance(raw, urllib3.BaseHTTPResponse):
+        chunks = _readinto_chunks(raw, chunk_size)
+      else:
+        chunks = response.iter_content(chunk_size=chunk_size)
 
     # Get content length if available
-    content_length = response.headers.get("Content-Length")
+    content_length = headers.get("Content-Length")
     total_size = int(content_length) if content_length else None
 
     downloaded_size = 0
 
     with open(target_path, "wb") as f:
-      for chunk in response.iter_content(chunk_size=chunk_size):
+      # Reserve the full size up front so the file is laid out contiguously
+      if total_size and hasattr(os, "posix_fallocate"):
+        try:
+          os.posix_fallocate(f.fileno(), 0, total_size)
+        except OSError:
+          pass
+
+      for chunk in chunks:
         if chunk:  # Filter out keep-alive chunks
           f.write(chunk)
           downloaded_size += len(chunk)
 
+      # Drop any preallocated space the body did not fill
+      f.truncate(downloaded_size)
+
     return {
       "status": "success",
       "url": url,
       "target_path": str(target_path),
       "downloaded_size": downloaded_size,
       "total_size": total_size,
-      "content_type": response.headers.get("Content-Type", "unknown"),
+      "content_type": headers.get("Content-Type", "unknown"),
     }
 
-  except requests.RequestException as e:
+  except (requests.RequestException, urllib3.exceptions.HTTPError) as e:
     # Clean up partial download
     if target_path.exists():
       target_path.unlink()
@@ -92,14 +171,98 @@ def download_file(
       target_path.unlink()
     raise OSError(f"Failed to write file {target_path}: {str(e)}") from e
   finally:
-    session.close()
+    if pooled_response is not None:
+      pooled_response.release_conn()
+    if session is not None:
+      session.close()
+
+
+def _find_corrupt_entry(jar_path: Path, names: List[str]) -> Optional[str]:
+  """Read entries through a private ZipFile handle and verify their CRCs.
+
+  ZipFile handles are not safe to share between threads, so each worker
+  opens its own.
+
+  Args:
+    jar_path: Path to JAR file
+    names: Entry names to check
+
+  Returns:
+    Name of the first entry that fails to decompress or verify, if any
+  """
+  with zipfile.ZipFile(jar_path, "r") as jar_zip:
+    for name in names:
+      try:
+        with jar_zip.open(name) as entry:
+          while entry.read(256 * 1024):
+            pass
+      except (zipfile.BadZipFile, zlib.error):
+        return name
+  return None
 
 
-def validate_jar_file(jar_path: Path) -> Dict[str, Any]:
+def _validate_open_jar(jar_zip: zipfile.ZipFile) -> Dict[str, Any]:
+  """Classify the entries of an open JAR from its central directory.
+
+  Entries are counted in one pass; entry data is never decompressed.
+
+  Args:
+    jar_zip: Open JAR file
+
+  Returns:
+    Dictionary containing entry statistics
+  """
+  infos = jar_zip.infolist()
+  java_files = 0
+  class_files = 0
+  for info in infos:
+    name = info.filename
+    if name.endswith(".java"):
+      java_files += 1
+    elif name.endswith(".class"):
+      class_files += 1
+
+  return {
+    "total_entries": len(infos),
+    "java_files": java_files,
+    "class_files": class_files,
+    "has_manifest": "META-INF/MANIFEST.MF" in jar_zip.NameToInfo,
+    "is_source_jar": java_files > 0 and class_files == 0,
+  }
+
+
+def _verify_entry_crcs(jar_path: Path, names: List[str]) -> None:
+  """Decompress entries on a thread pool and verify their CRCs.
+
+  Args:
+    jar_path: Path to JAR file
+    names: Names of the file entries to check
+
+  Raises:
+    ValueError: If any entry is corrupted
+  """
+  workers = min(8, os.cpu_count() or 1)
+  stripes = [names[i::workers] for i in range(workers)]
+  with ThreadPoolExecutor(max_workers=workers) as executor:
+    corrupt = [
+      name
+      for name in executor.map(partial(_find_corrupt_entry, jar_path), stripes)
+      if name is not None
+    ]
+
+  if corrupt:
+    # Report the earliest corrupt entry, as testzip() would
+    position = {name: i for i, name in enumerate(names)}
+    first = min(corrupt, key=position.__getitem__)
+    raise ValueError(f"JAR file is corrupted at entry: {first}")
+
+
+def validate_jar_file(jar_path: Path, deep: bool = False) -> Dict[str, Any]:
   """Validate that a file is a valid JAR file.
 
   Args:
     jar_path: Path to JAR file to validate
+    deep: Also decompress every entry and verify its CRC, spread across threads
 
   Returns:
     Dictionary containing validation results
@@ -113,36 +276,36 @@ def validate_jar_file(jar_path: Path) -> Dict[str, Any]:
   if not jar_path.is_file():
     raise ValueError(f"Path is not a file: {jar_path}")
 
-  if jar_path.stat().st_size == 0:
+  file_size = jar_path.stat().st_size
+  if file_size == 0:
     raise ValueError(f"JAR file is empty: {jar_path}")
 
-  try:
-    with zipfile.ZipFile(jar_path, "r") as jar_zip:
-      # Check if it's a valid ZIP file
-      zip_info = jar_zip.testzip()
-      if zip_info is not None:
-        raise ValueError(f"JAR file is corrupted at entry: {zip_info}")
-
-      # Get file list and basic statistics
-      file_list = jar_zip.namelist()
-      java_files = [f for f in file_list if f.endswith(".java")]
-      class_files = [f for f in file_list if f.endswith(".class")]
-
-      # Check for manifest (JAR-specific validation)
-      has_manifest = "META-INF/MANIFEST.MF" in file_list
-
-      return {
-        "status": "valid",
-        "jar_path": str(jar_path),
-        "file_size": jar_path.stat().st_size,
-        "total_entries": len(file_list),
-        "java_files": len(java_files),
-        "class_files": len(class_files),
-        "has_manifest": has_manifest,
-        "is_source_jar": len(java_files) > 0 and len(class_files) == 0,
-      }
-
-  except zipfile.BadZipFile as e:
-    raise ValueError(f"Invalid ZIP/JAR file format: {jar_path} - {str(e)}") from e
-  except Exception as e:
-    raise ValueError(f"Failed to validate JAR file {jar_path}: {str(e)}") from e
+  # One handle serves both the magic-bytes check and the ZipFile
+  with open(jar_path, "rb") as jar_file:
+    # A leading ZIP signature is only a fast accept path: executable JARs may
+    # carry a launcher stub in front, so fall back to locating the end record
+    if jar_file.read(4) not in _ZIP_MAGIC and not zipfile.is_zipfile(jar_file):
+      raise ValueError(f"Invalid ZIP/JAR file format: {jar_path}")
+    jar_file.seek(0)
+
+    try:
+      with zipfile.ZipFile(jar_file, "r") as jar_zip:
+        entry_stats = _validate_open_jar(jar_zip)
+
+        if deep:
+          _verify_entry_crcs(
+            jar_path,
+            [info.filename for info in jar_zip.infolist() if not info.is_dir()],
+          )
+
+    except zipfile.BadZipFile as e:
+      raise ValueError(f"Invalid ZIP/JAR file format: {jar_path} - {str(e)}") from e
+    except Exception as e:
+      raise ValueError(f"Failed to validate JAR file {jar_path}: {str(e)}") from e
+
+  return {
+    "status": "valid",
+    "jar_path": str(jar_path),
+    "file_size": file_size,
+    **entry_stats,
+  }
@@ -1,8 +1,16 @@
 """File system exploration utilities."""
 
+import fnmatch
+import importlib
+import io
+import os
 import re
+import stat
+from bisect import bisect_left
+from functools import lru_cache, partial
+from itertools import chain, islice
 from pathlib import Path
-from typing import Dict, List
+from typing import Any, Dict, Iterable, List
 
 from ..jartype.core_types import (
   FileInfo,
@@ -17,6 +25,154 @@ from ..jartype.core_types import (
   SearchMatch,
 )
 
+# Optional "search" extra; loaded dynamically since it ships no type stubs and
+# is usually absent. Regex content search falls back to re without it.
+hyperscan: Any = None
+try:
+  hyperscan = importlib.import_module("hyperscan")
+except ImportError:
+  pass
+
+# Bytes inspected for null bytes when deciding whether a file is binary
+_BINARY_SNIFF_SIZE = 8192
+# Slice size used when counting newlines
+_LINE_COUNT_CHUNK = 1024 * 1024
+# String anchors: re applies them to each line, Hyperscan to the whole file
+_STRING_ANCHOR = re.compile(r"\\[AZz]")
+
+
+@lru_cache(maxsize=256)
+def _compile_pattern(pattern: str, ptype: str) -> re.Pattern[str]:
+  """Compile a regex or glob pattern, reusing earlier compilations.
+
+  Args:
+    pattern: Regular expression or shell-style glob
+    ptype: Pattern type ("regex" or "glob")
+
+  Returns:
+    Compiled regular expression; glob patterns must be applied with match()
+
+  Raises:
+    re.error: If a regex pattern is invalid
+  """
+  if ptype == "glob":
+    return re.compile(fnmatch.translate(pattern))
+  return re.compile(pattern)
+
+
+@lru_cache(maxsize=64)
+def _compile_hyperscan(query: str) -> Any:
+  """Compile a regex query into a Hyperscan database when possible.
+
+  Args:
+    query: Regular expression to compile
+
+  Returns:
+    Hyperscan database, or None if Hyperscan is unavailable, the pattern uses
+    string anchors, or Hyperscan rejects it (unsupported syntax, or it can
+    match the empty string)
+  """
+  if hyperscan is None or not query.isascii() or _STRING_ANCHOR.search(query):
+    return None
+
+  db = hyperscan.Database()
+  try:
+    db.compile(
+      expressions=[query.encode()],
+      ids=[0],
+      elements=1,
+      flags=[hyperscan.HS_FLAG_SOM_LEFTMOST | hyperscan.HS_FLAG_MULTILINE],
+    )
+  except hyperscan.error:
+    return None
+  return db
+
+
+def _hyperscan_candidate_lines(db: Any, data: bytes) -> List[int]:
+  """Find the 1-based line numbers a Hyperscan database matches in data.
+
+  Matches may span lines, so every line a match touches is returned; callers
+  must still confirm each line with the equivalent re pattern.
+
+  Args:
+    db: Compiled Hyperscan database
+    data: Raw file content
+
+  Returns:
+    Sorted line numbers that may contain a match
+  """
+  spans: List[tuple[int, int]] = []
+
+  def on_match(_id: int, start: int, end: int, _flags: int, _context: Any) -> None:
+    spans.append((start, end))
+
+  db.scan(data, match_event_handler=on_match)
+  return _lines_for_spans(data, spans)
+
+
+def _find_candidate_lines(data: bytes, needle: bytes) -> List[int]:
+  """Find the 1-based line numbers where needle occurs in data.
+
+  Occurrences containing a newline touch several lines, so callers must still
+  confirm each line with a substring check.
+
+  Args:
+    data: Raw file content
+    needle: Non-empty byte string to search for
+
+  Returns:
+    Sorted line numbers that may contain needle
+  """
+  spans: List[tuple[int, int]] = []
+  pos = data.find(needle)
+  while pos >= 0:
+    spans.append((pos, pos + len(needle)))
+    pos = data.find(needle, pos + len(needle))
+  return _lines_for_spans(data, spans)
+
+
+def _lines_for_spans(data: bytes, spans: List[tuple[int, int]]) -> List[int]:
+  """Map byte spans in data to the sorted 1-based line numbers they touch."""
+  if not spans:
+    return []
+
+  newlines = [m.start() for m in re.finditer(b"\n", data)]
+  candidates: set[int] = set()
+  for start, end in spans:
+    first = bisect_left(newlines, start) + 1
+    last = bisect_left(newlines, max(start, end - 1)) + 1
+    candidates.update(range(first, last + 1))
+  return sorted(candidates)
+
+
+def _count_lines(chunks: Iterable[bytes]) -> int:
+  """Count lines the way universal-newline text mode splits them.
+
+  "\n", "\r\n" and a lone "\r" each end a line, matching get_file_content.
+
+  Args:
+    chunks: Consecutive pieces of the file content
+
+  Returns:
+    Number of lines, counting a final line without a line ending
+  """
+  line_count = 0
+  last_byte = b""
+  for chunk in chunks:
+    line_count += chunk.count(b"\n")
+    carriage_returns = chunk.count(b"\r")
+    if carriage_returns:
+      # "\r\n" is one line ending, already counted by its "\n"
+      line_count += carriage_returns - chunk.count(b"\r\n")
+    if last_byte == b"\r" and chunk[:1] == b"\n":
+      # A "\r\n" split across chunks was counted twice
+      line_count -= 1
+    if chunk:
+      last_byte = chunk[-1:]
+  if last_byte not in (b"", b"\n", b"\r"):
+    line_count += 1
+  return line_count
+
 
 def get_file_info(file_path: str) -> FileInfo:
   """Get file metadata information.
@@ -30,15 +186,18 @@ def get_file_info(file_path: str) -> FileInfo:
   Raises:
     ValueError: If path doesn't exist or is not a file
   """
-  path_obj = Path(file_path)
-
-  if not path_obj.exists():
-    raise ValueError(f"Path does not exist: {file_path}")
-
-  if not path_obj.is_file():
+  # A single stat answers existence, type and size
+  try:
+    stat_info = os.stat(file_path)
+  except (FileNotFoundError, NotADirectoryError) as e:
+    raise ValueError(f"Path does not exist: {file_path}") from e
+  except OSError as e:
+    # Symlink loops (ELOOP), permission errors and the like
+    raise ValueError(f"Cannot access path: {file_path} - {str(e)}") from e
+
+  if not stat.S_ISREG(stat_info.st_mode):
     raise ValueError(f"Path is not a file: {file_path}")
 
-  stat_info = path_obj.stat()
   file_size = stat_info.st_size
 
   # Format file size in human-readable format
@@ -63,22 +222,22 @@ def get_file_info(file_path: str) -> FileInfo:
   # Count lines for text files
   line_count = 0
   try:
-    # Check if file appears to be binary by reading first 1024 bytes
-    with open(path_obj, "rb") as f:
-      chunk = f.read(1024)
-      # If chunk contains null bytes, treat as binary
-      if b"\x00" in chunk:
-        line_count = 0
-      else:
-        # Try to read as text file to count lines
-        with open(path_obj, "r", encoding="utf-8", errors="ignore") as text_f:
-          line_count = sum(1 for _ in text_f)
-  except (UnicodeDecodeError, OSError):
-    # If it's a binary file or can't be read, set line_count to 0
+    with open(file_path, "rb") as f:
+      head = f.read(_BINARY_SNIFF_SIZE)
+      # If the head contains null bytes, treat as binary
+      if head and b"\x00" not in head:
+        # Count chunk by chunk; memory stays flat for any file size
+        line_count = _count_lines(
+          chain((head,), iter(partial(f.read, _LINE_COUNT_CHUNK), b""))
+        )
+  except OSError:
+    # If the file can't be read, set line_count to 0
     line_count = 0
 
   return FileInfo(
-    name=path_obj.name, size=format_file_size(file_size), line_count=line_count
+    name=os.path.basename(file_path),
+    size=format_file_size(file_size),
+    line_count=line_count,
   )
 
 
@@ -105,61 +264,51 @@ def list_directory_tree(
   if not start.is_dir():
     raise ValueError(f"Start path is not a directory: {start}")
 
-  def _build_folder_info(path: Path, current_depth: int) -> FolderInfo:
-    """Build folder information recursively."""
-    files: List[FileInfo] = []
-    folders: List[FolderInfo] = []
-
-    if include_files:
-      # Get files in current directory
-      for item in path.iterdir():
-        if item.is_file():
-          try:
-            file_info = get_file_info(str(item))
-            files.append(file_info)
-          except ValueError:
-            # Skip files that can't be read
-            pass
-
-    # Get subdirectories if we haven't reached max depth
-    if current_depth < max_depth:
-      for item in path.iterdir():
-        if item.is_dir():
-          try:
-            folder_info = _build_folder_info(item, current_depth + 1)
-            folders.append(folder_info)
-          except (PermissionError, OSError):
-            # Skip directories that can't be accessed
-            pass
-
-    # Count files in directory
-    file_count = len([item for item in path.iterdir() if item.is_file()])
-
-    return FolderInfo(
-      name=path.name, file_count=file_count, files=files, folders=folders
-    )
-
-  # Build root level structure
+  start_dir = str(start)
   root_files: List[FileInfo] = []
   root_folders: List[FolderInfo] = []
 
-  if include_files:
-    for item in start.iterdir():
-      if item.is_file():
+  # Subfolder lists and depths keyed by directory path, so each directory
+  # os.walk visits can attach itself to its parent in O(1)
+  folders_by_dir: Dict[str, List[FolderInfo]] = {start_dir: root_folders}
+  depth_by_dir: Dict[str, int] = {start_dir: 0}
+
+  # Directories that can't be listed are skipped by os.walk
+  for dir_path, dir_names, file_names in os.walk(start_dir, followlinks=True):
+    depth = depth_by_dir[dir_path]
+    files: List[FileInfo] = root_files if depth == 0 else []
+
+    # os.walk lists every non-directory entry, including dangling links and
+    # symlink loops; only entries that stat as regular files are counted
+    file_count = 0
+    for file_name in file_names:
+      file_path = os.path.join(dir_path, file_name)
+      if include_files:
         try:
-          file_info = get_file_info(str(item))
-          root_files.append(file_info)
+          files.append(get_file_info(file_path))
         except ValueError:
-          pass
-
-  # Get subdirectories
-  for item in start.iterdir():
-    if item.is_dir():
-      try:
-        folder_info = _build_folder_info(item, 1)
-        root_folders.append(folder_info)
-      except (PermissionError, OSError):
-        pass
+          # Skip files that can't be read
+          continue
+        file_count += 1
+      elif depth > 0 and os.path.isfile(file_path):
+        file_count += 1
+
+    if depth > 0:
+      folder = FolderInfo(
+        name=os.path.basename(dir_path),
+        file_count=file_count,
+        files=files,
+        folders=[],
+      )
+      folders_by_dir[os.path.dirname(dir_path)].append(folder)
+      folders_by_dir[dir_path] = folder["folders"]
+
+    # Root subdirectories are always listed; deeper ones stop at max depth
+    if depth >= max(max_depth, 1):
+      dir_names[:] = []
+    else:
+      for dir_name in dir_names:
+        depth_by_dir[os.path.join(dir_path, dir_name)] = depth + 1
 
   return ListDirectoryTreeResult(
     path=str(start.relative_to(base)) if start != base else "",
@@ -202,29 +351,19 @@ def get_file_content(
   # Get file info
   file_info = get_file_info(str(full_path))
 
-  # Read file content
+  # Resolve the requested range to 0-based slice bounds
+  start_idx = max(0, start_line - 1) if start_line is not None else 0
+  end_idx = max(start_idx, end_line) if end_line is not None else None
+
+  # Read only as far as the last requested line
   try:
     with open(full_path, "r", encoding="utf-8", errors="ignore") as f:
-      lines = f.readlines()
+      selected_lines = list(islice(f, start_idx, end_idx))
   except (UnicodeDecodeError, OSError) as e:
     raise PermissionError(f"Cannot read file {file_path}: {str(e)}") from e
 
-  # Apply line range if specified
-  if start_line is not None or end_line is not None:
-    start_idx = (start_line - 1) if start_line is not None else 0
-    end_idx = end_line if end_line is not None else len(lines)
-
-    # Ensure valid range
-    start_idx = max(0, start_idx)
-    end_idx = min(len(lines), end_idx)
-
-    selected_lines = lines[start_idx:end_idx]
-    actual_start = start_idx + 1
-    actual_end = end_idx
-  else:
-    selected_lines = lines
-    actual_start = 1
-    actual_end = len(lines)
+  actual_start = start_idx + 1
+  actual_end = start_idx + len(selected_lines)
 
   content = "".join(selected_lines)
 
@@ -266,53 +405,53 @@ def search_files_by_pattern(
 
   matched_files: list[FileSearchResult] = []
 
-  def _search_directory(path: Path, current_depth: int):
+  # Compile once per call; glob patterns match against the filename only
+  compiled = (
+    _compile_pattern(pattern, pattern_type)
+    if pattern_type in ("glob", "regex")
+    else None
+  )
+
+  def _matches(name: str) -> bool:
+    """Check whether a file name matches the search pattern."""
+    if compiled is None:
+      return False
+    if pattern_type == "glob":
+      return compiled.match(name) is not None
+    return compiled.search(name) is not None
+
+  def _search_directory(path: str, relative_dir: str, current_depth: int):
     """Search directory recursively."""
     if max_depth is not None and current_depth > max_depth:
       return
 
     try:
-      for item in path.iterdir():
-        if item.is_file():
-          # Check if file matches pattern
-          relative_path = item.relative_to(base)
-
-          if pattern_type == "glob":
-            # Match pattern against filename only (not full path)
-            if item.match(pattern):
-              try:
-                file_info = get_file_info(str(item))
-                matched_files.append(
-                  FileSearchResult(
-                    name=item.name,
-                    path=str(relative_path),
-                    size=file_info["size"],
-                    line_count=file_info["line_count"],
-                  )
-                )
-              except ValueError:
-                pass
-          elif pattern_type == "regex":
-            if re.search(pattern, item.name):
+      with os.scandir(path) as entries:
+        for entry in entries:
+          if entry.is_file():
+            if _matches(entry.name):
               try:
-                file_info = get_file_info(str(item))
+                file_info = get_file_info(entry.path)
                 matched_files.append(
                   FileSearchResult(
-                    name=item.name,
-                    path=str(relative_path),
+                    name=entry.name,
+                    path=os.path.join(relative_dir, entry.name),
                     size=file_info["size"],
                     line_count=file_info["line_count"],
                   )
                 )
               except ValueError:
                 pass
-        elif item.is_dir():
-          _search_directory(item, current_depth + 1)
+          elif entry.is_dir():
+            _search_directory(
+              entry.path, os.path.join(relative_dir, entry.name), current_depth + 1
+            )
     except (PermissionError, OSError):
       # Skip directories that can't be accessed
       pass
 
-  _search_directory(start, 0)
+  root_relative = str(start.relative_to(base)) if start != base else ""
+  _search_directory(str(start), root_relative, 0)
 
   return SearchFilesByPatternResult(files=matched_files)
 
@@ -354,7 +493,17 @@ def search_file_contents(
   matches: Dict[str, list[SearchMatch]] = {}
   total_results = 0
 
-  def _search_file_content(file_path: Path):
+  compiled_query: re.Pattern[str] | None = None
+  hyperscan_db: Any = None
+  if query_type == "regex":
+    try:
+      compiled_query = _compile_pattern(query, "regex")
+      hyperscan_db = _compile_hyperscan(query)
+    except re.error:
+      # An invalid regex matches nothing
+      pass
+
+  def _search_file_content(file_path: str, relative_path: str):
     """Search content in a single file."""
     nonlocal total_results
 
@@ -362,31 +511,43 @@ def search_file_contents(
       return
 
     try:
-      with open(file_path, "r", encoding="utf-8", errors="ignore") as f:
-        lines = f.readlines()
+      with open(file_path, "rb") as f:
+        # Skip binary files, judged by null bytes in the head like get_file_info
+        head = f.read(_BINARY_SNIFF_SIZE)
+        if b"\x00" in head:
+          return
+        data = head + f.read()
+      lines = io.TextIOWrapper(
+        io.BytesIO(data), encoding="utf-8", errors="ignore"
+      ).readlines()
     except (UnicodeDecodeError, OSError):
       return
 
+    # Pick candidate lines with a byte-level scan when byte offsets map
+    # cleanly onto the decoded lines (ASCII content, no CR line endings)
+    line_numbers: Iterable[int] = range(1, len(lines) + 1)
+    if data.isascii() and b"\r" not in data:
+      if query_type == "string" and query:
+        line_numbers = _find_candidate_lines(data, query.encode())
+      elif hyperscan_db is not None:
+        line_numbers = _hyperscan_candidate_lines(hyperscan_db, data)
+
     file_matches: List[SearchMatch] = []
 
-    for line_num, line in enumerate(lines, 1):
+    for line_num in line_numbers:
       if max_results is not None and total_results >= max_results:
         break
 
+      line = lines[line_num - 1]
+
       # Check if line matches query
       if query_type == "string":
         if query in line:
           match_found = True
         else:
           match_found = False
-      elif query_type == "regex":
-        try:
-          if re.search(query, line):
-            match_found = True
-          else:
-            match_found = False
-        except re.error:
-          continue
+      elif compiled_query is not None:
+        match_found = compiled_query.search(line) is not None
       else:
         continue
 
@@ -412,10 +573,9 @@ def search_file_contents(
         total_results += 1
 
     if file_matches:
-      relative_path = str(file_path.relative_to(base))
       matches[relative_path] = file_matches
 
-  def _search_directory(path: Path, current_depth: int):
+  def _search_directory(path: str, relative_dir: str, current_depth: int):
     """Search directory recursively."""
     if max_depth is not None and current_depth > max_depth:
       return
@@ -424,18 +584,21 @@ def search_file_contents(
       return
 
     try:
-      for item in path.iterdir():
-        if max_results is not None and total_results >= max_results:
-          break
-
-        if item.is_file():
-          _search_file_content(item)
-        elif item.is_dir():
-          _search_directory(item, current_depth + 1)
+      with os.scandir(path) as entries:
+        for entry in entries:
+          if max_results is not None and total_results >= max_results:
+            break
+
+          relative_path = os.path.join(relative_dir, entry.name)
+          if entry.is_file():
+            _search_file_content(entry.path, relative_path)
+          elif entry.is_dir():
+            _search_directory(entry.path, relative_path, current_depth + 1)
     except (PermissionError, OSError):
       pass
 
-  _search_directory(start, 0)
+  root_relative = str(start.relative_to(base)) if start != base else ""
+  _search_directory(str(start), root_relative, 0)
 
   search_config = SearchConfig(
     query=query,
@@ -1,10 +1,28 @@
 """Path manipulation and validation utilities."""
 
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any
 
 
+@lru_cache(maxsize=4096)
+def _normalize_from(path: str, cwd: str) -> str:
+  """Resolve a stripped path against a working directory.
+
+  Pure in both arguments, so results are cached; keying on cwd keeps cached
+  entries correct after os.chdir().
+
+  Args:
+    path: Non-empty, stripped path string
+    cwd: Working directory the path is relative to
+
+  Returns:
+    Normalized absolute path
+  """
+  return os.path.normpath(os.path.join(cwd, path))
+
+
 def normalize_path(path: str) -> str:
   """Cross-platform path normalization.
 
@@ -24,9 +42,10 @@ def normalize_path(path: str) -> str:
   if not path:
     raise ValueError("Path cannot be empty or whitespace only")
 
-  # Normalize path using os.path.normpath and convert to absolute path
-  normalized = os.path.normpath(os.path.abspath(path))
-  return normalized
+  # Same result as normpath(abspath(path)), served from the cache when possible;
+  # absolute paths do not depend on the working directory, so skip getcwd()
+  cwd = "" if os.path.isabs(path) else os.getcwd()
+  return _normalize_from(path, cwd)
 
 
 def calculate_directory_depth(base_path: str, target_path: str) -> int:
@@ -45,25 +64,22 @@ def calculate_directory_depth(base_path: str, target_path: str) -> int:
   normalized_base = normalize_path(base_path)
   normalized_target = normalize_path(target_path)
 
-  # Check if target path is under base path
-  try:
-    relative_path = os.path.relpath(normalized_target, normalized_base)
-  except ValueError as e:
-    raise ValueError(f"Cannot calculate relative path: {e}") from e
+  # If paths are the same, depth is 0
+  if normalized_target == normalized_base:
+    return 0
 
-  # If relative path starts with '..', target is not under base
-  if relative_path.startswith(".."):
+  # Both paths are normalized, so containment is a plain prefix check; the
+  # root directory already ends with a separator
+  prefix = (
+    normalized_base if normalized_base.endswith(os.sep) else normalized_base + os.sep
+  )
+  if not normalized_target.startswith(prefix):
     raise ValueError(
       f"Target path is not under base path: {target_path} not under {base_path}"
     )
 
-  # If paths are the same, depth is 0
-  if relative_path == ".":
-    return 0
-
-  # Count path components to determine depth
-  path_parts = Path(relative_path).parts
-  return len(path_parts)
+  # Count separators in the remainder to determine depth
+  return normalized_target.count(os.sep, len(prefix)) + 1
 
 
 def ensure_directory(dir_path: Path, mode: int = 0o755) -> Dict[str, Any]:
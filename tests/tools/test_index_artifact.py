@@ -3,7 +3,7 @@
 import json
 import tempfile
 from pathlib import Path
-from typing import Generator
+from typing import Generator, cast
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -182,6 +182,33 @@ class TestIndexArtifact:
       assert "message" in result
       assert "No JAR files found" in result.get("message", "")
 
+  @pytest.mark.asyncio
+  async def test_index_artifact_incomplete_source_info(
+    self, temp_storage: Path
+  ) -> None:
+    """Test source info without coordinates reports an extraction failure."""
+    source_info = cast(
+      RegisteredSourceInfo,
+      {"source_type": "jar", "local_path": "source-jar/org/example/test-lib/1.0.0"},
+    )
+
+    with (
+      patch("src.tools.index_artifact.validate_maven_coordinates"),
+      patch("src.tools.index_artifact.StorageManager") as mock_storage_class,
+      patch("src.tools.index_artifact.is_artifact_code_available", return_value=False),
+      patch(
+        "src.tools.index_artifact.get_registered_source_info", return_value=source_info
+      ),
+    ):
+      mock_storage = MagicMock()
+      mock_storage.base_path = temp_storage
+      mock_storage_class.return_value = mock_storage
+
+      result = await index_artifact("org.example", "test-lib", "1.0.0")
+
+      assert result.get("status") == "extraction_failed"
+      assert "group_id" in result.get("message", "")
+
   @pytest.mark.asyncio
   async def test_index_artifact_code_already_available(
     self, temp_storage: Path
@@ -691,7 +691,9 @@ class TestHandleLocalJarFile:
     parsed_info = {"path": str(temp_jar_file)}
 
     with (
-      patch("src.tools.register_source.validate_jar_file", return_value=True),
+      patch(
+        "src.tools.register_source.validate_jar_file", return_value=True
+      ) as mock_validate,
       patch("pathlib.Path.mkdir") as mock_mkdir,
       patch("shutil.copy2") as mock_copy,
     ):
@@ -703,6 +705,7 @@ class TestHandleLocalJarFile:
         "5.3.21",
       )
 
+      mock_validate.assert_called_once_with(temp_jar_file, deep=True)
       mock_mkdir.assert_called_once_with(parents=True, exist_ok=True)
       mock_copy.assert_called_once()
 
@@ -781,7 +784,9 @@ class TestHandleRemoteJarFile:
 
     with (
       patch("src.tools.register_source.download_file") as mock_download,
-      patch("src.tools.register_source.validate_jar_file", return_value=True),
+      patch(
+        "src.tools.register_source.validate_jar_file", return_value=True
+      ) as mock_validate,
       patch("pathlib.Path.mkdir") as mock_mkdir,
     ):
       await _handle_remote_jar_file(
@@ -794,6 +799,7 @@ class TestHandleRemoteJarFile:
 
       mock_mkdir.assert_called_once_with(parents=True, exist_ok=True)
       mock_download.assert_called_once()
+      mock_validate.assert_called_once_with(mock_download.call_args.args[1], deep=True)
 
   @pytest.mark.asyncio
   async def test_handle_remote_jar_file_download_failed(
@@ -14,6 +14,11 @@ from src.tools.search_file_names import handle_search_file_names, search_file_na
 class TestSearchFileNames:
   """Test cases for search_file_names functionality."""
 
+  @pytest.fixture(autouse=True)
+  def identity_normalize_path(self, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Pass start_path through normalize_path unchanged."""
+    monkeypatch.setattr("src.tools.search_file_names.normalize_path", str)
+
   @pytest.fixture
   def temp_storage(self) -> Generator[Path, None, None]:
     """Create temporary storage directory."""
@@ -61,7 +66,6 @@ class TestSearchFileNames:
         "src.tools.search_file_names.search_files_by_pattern",
         return_value=mock_search_result,
       ),
-      patch("src.tools.search_file_names.normalize_path", return_value="src"),
     ):
       mock_storage = MagicMock()
       mock_storage.get_code_path = MagicMock(return_value=code_path)
@@ -133,7 +137,6 @@ class TestSearchFileNames:
         "src.tools.search_file_names.is_artifact_code_available", return_value=True
       ),
       patch("src.tools.search_file_names.StorageManager") as mock_storage_class,
-      patch("src.tools.search_file_names.normalize_path", return_value="nonexistent"),
     ):
       mock_storage = MagicMock()
       mock_storage.get_code_path = MagicMock(return_value=code_path)
@@ -161,7 +164,6 @@ class TestSearchFileNames:
         "src.tools.search_file_names.is_artifact_code_available", return_value=True
       ),
       patch("src.tools.search_file_names.StorageManager") as mock_storage_class,
-      patch("src.tools.search_file_names.normalize_path", return_value="test.txt"),
     ):
       mock_storage = MagicMock()
       mock_storage.get_code_path = MagicMock(return_value=code_path)
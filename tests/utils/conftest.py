@@ -0,0 +1,11 @@
+"""Shared fixtures for utility tests."""
+
+from pathlib import Path
+
+import pytest
+
+
+@pytest.fixture
+def temp_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+  """Create temporary directory for tests."""
+  return tmp_path_factory.mktemp("temp_dir")
@@ -1,10 +1,13 @@
 """Tests for cache_utils module."""
 
+import atexit
 import os
+import shutil
 import tempfile
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Iterable
-from unittest.mock import patch
+from typing import Iterable, Iterator
+from uuid import uuid4
 
 import pytest
 
@@ -17,56 +20,110 @@ from src.utils.cache_utils import (
 )
 
 
+@contextmanager
+def fast_tmpdir() -> Iterator[Path]:
+  """Create a temporary directory whose removal is deferred to interpreter exit."""
+  path = Path(tempfile.mkdtemp())
+  try:
+    yield path
+  finally:
+    atexit.register(shutil.rmtree, os.fspath(path), ignore_errors=True)
+
+
+@pytest.fixture(scope="module")
+def _tmp_root() -> Iterable[Path]:
+  """Create one temporary directory shared by every test in this module."""
+  with fast_tmpdir() as temp_dir:
+    yield temp_dir
+
+
+SHARED_MAVEN_VERSIONS = ["5.3.21", "6.0.0", "6.0.1"]
+SPRING_CORE = "org.springframework:spring-core"
+
+
+def _make_maven_jar(base: Path, ga: str, v: str) -> Path:
+  """Create an empty Maven source JAR for group:artifact ga at version v."""
+  group_id, artifact_id = ga.split(":")
+  version_dir = f"{base}/{group_id.replace('.', '/')}/{artifact_id}/{v}"
+  os.makedirs(version_dir, exist_ok=True)
+  source_jar = f"{version_dir}/{artifact_id}-{v}-sources.jar"
+  open(source_jar, "w").close()
+  return Path(source_jar)
+
+
+def _make_gradle_jar(base: Path, ga: str, v: str) -> Path:
+  """Create an empty Gradle source JAR for group:artifact ga at version v."""
+  group_id, artifact_id = ga.split(":")
+  hash_dir = f"{base}/modules-2/files-2.1/{group_id}/{artifact_id}/{v}/hash_{v}"
+  os.makedirs(hash_dir, exist_ok=True)
+  source_jar = f"{hash_dir}/{artifact_id}-{v}-sources.jar"
+  open(source_jar, "w").close()
+  return Path(source_jar)
+
+
+@pytest.fixture(scope="module")
+def shared_maven_repo(_tmp_root: Path) -> Path:
+  """Create a read-only Maven repository with several spring-core versions."""
+  maven_repo = _tmp_root / "shared" / ".m2" / "repository"
+  for version in SHARED_MAVEN_VERSIONS:
+    _make_maven_jar(maven_repo, SPRING_CORE, version)
+  return maven_repo
+
+
 class TestCacheUtils:
   """Test cases for cache utilities."""
 
   @pytest.fixture
-  def temp_maven_repo(self) -> Iterable[Path]:
+  def temp_maven_repo(self, _tmp_root: Path) -> Path:
     """Create temporary Maven repository."""
-    with tempfile.TemporaryDirectory() as temp_dir:
-      maven_repo = Path(temp_dir) / ".m2" / "repository"
-      maven_repo.mkdir(parents=True, exist_ok=True)
-      yield maven_repo
+    maven_repo = _tmp_root / f"maven_{uuid4().hex}" / ".m2" / "repository"
+    maven_repo.mkdir(parents=True)
+    return maven_repo
 
   @pytest.fixture
-  def temp_gradle_cache(self) -> Iterable[Path]:
+  def temp_gradle_cache(self, _tmp_root: Path) -> Path:
     """Create temporary Gradle cache."""
-    with tempfile.TemporaryDirectory() as temp_dir:
-      gradle_cache = Path(temp_dir) / ".gradle" / "caches"
-      gradle_cache.mkdir(parents=True, exist_ok=True)
-      yield gradle_cache
+    gradle_cache = _tmp_root / f"gradle_{uuid4().hex}" / ".gradle" / "caches"
+    gradle_cache.mkdir(parents=True)
+    return gradle_cache
 
-  def test_get_maven_cache_paths_default(self, temp_maven_repo: Path) -> None:
+  def test_get_maven_cache_paths_default(
+    self, temp_maven_repo: Path, monkeypatch: pytest.MonkeyPatch
+  ) -> None:
     """Test getting default Maven cache paths."""
-    with patch("pathlib.Path.home", return_value=temp_maven_repo.parent.parent):
-      paths = get_maven_cache_paths()
-      assert len(paths) == 1
-      assert paths[0] == temp_maven_repo
+    monkeypatch.setenv("HOME", os.fspath(temp_maven_repo.parent.parent))
 
-  def test_get_maven_cache_paths_with_m2_home(self, temp_maven_repo: Path) -> None:
+    paths = get_maven_cache_paths()
+    assert len(paths) == 1
+    assert paths[0] == temp_maven_repo
+
+  def test_get_maven_cache_paths_with_m2_home(
+    self, temp_maven_repo: Path, monkeypatch: pytest.MonkeyPatch
+  ) -> None:
     """Test getting Maven cache paths with M2_HOME."""
     m2_home = temp_maven_repo.parent.parent / "custom_maven"
     m2_home.mkdir(parents=True, exist_ok=True)
     custom_repo = m2_home / "repository"
     custom_repo.mkdir(parents=True, exist_ok=True)
 
-    with patch.dict(os.environ, {"M2_HOME": str(m2_home)}), patch(
-      "pathlib.Path.home", return_value=Path("/nonexistent")
-    ):
-      paths = get_maven_cache_paths()
-      assert custom_repo in paths
+    monkeypatch.setenv("M2_HOME", os.fspath(m2_home))
+    monkeypatch.setenv("HOME", "/nonexistent")
 
-  def test_get_gradle_cache_paths_default(self, temp_gradle_cache: Path) -> None:
+    paths = get_maven_cache_paths()
+    assert custom_repo in paths
+
+  def test_get_gradle_cache_paths_default(
+    self, temp_gradle_cache: Path, monkeypatch: pytest.MonkeyPatch
+  ) -> None:
     """Test getting default Gradle cache paths."""
-    with patch(
-      "pathlib.Path.home", return_value=temp_gradle_cache.parent.parent
-    ):
-      paths = get_gradle_cache_paths()
-      assert len(paths) == 1
-      assert paths[0] == temp_gradle_cache
+    monkeypatch.setenv("HOME", os.fspath(temp_gradle_cache.parent.parent))
+
+    paths = get_gradle_cache_paths()
+    assert len(paths) == 1
+    assert paths[0] == temp_gradle_cache
 
   def test_get_gradle_cache_paths_with_gradle_home(
-    self, temp_gradle_cache: Path
+    self, temp_gradle_cache: Path, monkeypatch: pytest.MonkeyPatch
   ) -> None:
     """Test getting Gradle cache paths with GRADLE_HOME."""
     gradle_home = temp_gradle_cache.parent.parent / "custom_gradle"
@@ -74,297 +131,244 @@ class TestCacheUtils:
     custom_cache = gradle_home / "caches"
     custom_cache.mkdir(parents=True, exist_ok=True)
 
-    with patch.dict(os.environ, {"GRADLE_HOME": str(gradle_home)}), patch(
-      "pathlib.Path.home", return_value=Path("/nonexistent")
-    ):
-      paths = get_gradle_cache_paths()
-      assert custom_cache in paths
+    monkeypatch.setenv("GRADLE_HOME", os.fspath(gradle_home))
+    monkeypatch.setenv("HOME", "/nonexistent")
+
+    paths = get_gradle_cache_paths()
+    assert custom_cache in paths
 
   def test_search_maven_source_jars_specific_version(
-    self, temp_maven_repo: Path
+    self, shared_maven_repo: Path, monkeypatch: pytest.MonkeyPatch
   ) -> None:
     """Test successful Maven source JAR search for specific version."""
-    # Create Maven repository structure
-    group_path = temp_maven_repo / "org" / "springframework" / "spring-core" / "5.3.21"
-    group_path.mkdir(parents=True, exist_ok=True)
+    source_jar = (
+      shared_maven_repo
+      / "org"
+      / "springframework"
+      / "spring-core"
+      / "5.3.21"
+      / "spring-core-5.3.21-sources.jar"
+    )
+    expected = os.fspath(source_jar)
+
+    monkeypatch.setattr(
+      "src.utils.cache_utils.get_maven_cache_paths", lambda: [shared_maven_repo]
+    )
 
-    source_jar = group_path / "spring-core-5.3.21-sources.jar"
-    source_jar.write_text("mock jar content")
+    result = search_maven_source_jars("org.springframework", "spring-core", "5.3.21")
+
+    assert len(result) == 1
+    assert result[0] == expected
+
+  @pytest.mark.parametrize(
+    "cache_type,versions",
+    [
+      ("maven", ["5.3.21", "6.0.0", "6.0.1"]),
+      ("gradle", ["5.3.21", "6.0.0"]),
+    ],
+  )
+  def test_search_source_jars_all_versions(
+    self,
+    _tmp_root: Path,
+    cache_type: str,
+    versions: list[str],
+    monkeypatch: pytest.MonkeyPatch,
+  ) -> None:
+    """Test Maven and Gradle source JAR search for all versions."""
+    cache_root = _tmp_root / f"{cache_type}_{uuid4().hex}"
+    make_jar = _make_maven_jar if cache_type == "maven" else _make_gradle_jar
+    expected_set = {
+      os.fspath(make_jar(cache_root, SPRING_CORE, version)) for version in versions
+    }
+
+    search = (
+      search_maven_source_jars if cache_type == "maven" else search_gradle_source_jars
+    )
+    monkeypatch.setattr(
+      f"src.utils.cache_utils.get_{cache_type}_cache_paths", lambda: [cache_root]
+    )
 
-    with patch(
-      "src.utils.cache_utils.get_maven_cache_paths", return_value=[temp_maven_repo]
-    ):
-      result = search_maven_source_jars(
-        "org.springframework", "spring-core", "5.3.21"
-      )
+    result = search("org.springframework", "spring-core", None)
+    result_set = set(result)
 
-      assert len(result) == 1
-      assert result[0] == str(source_jar.absolute())
+    assert len(result) == len(versions)
+    assert result_set == expected_set
 
-  def test_search_maven_source_jars_all_versions(
-    self, temp_maven_repo: Path
+  def test_search_maven_source_jars_not_found(
+    self, shared_maven_repo: Path, monkeypatch: pytest.MonkeyPatch
   ) -> None:
-    """Test Maven source JAR search for all versions."""
-    # Create multiple versions
-    versions = ["5.3.21", "6.0.0", "6.0.1"]
-    expected_jars: list[str] = []
-
-    for version in versions:
-      group_path = (
-        temp_maven_repo / "org" / "springframework" / "spring-core" / version
-      )
-      group_path.mkdir(parents=True, exist_ok=True)
-      source_jar = group_path / f"spring-core-{version}-sources.jar"
-      source_jar.write_text("mock jar content")
-      expected_jars.append(str(source_jar.absolute()))
-
-    with patch(
-      "src.utils.cache_utils.get_maven_cache_paths", return_value=[temp_maven_repo]
-    ):
-      result = search_maven_source_jars("org.springframework", "spring-core", None)
-
-      assert len(result) == 3
-      assert set(result) == set(expected_jars)
-
-  def test_search_maven_source_jars_not_found(self, temp_maven_repo: Path) -> None:
     """Test Maven source JAR not found."""
-    with patch(
-      "src.utils.cache_utils.get_maven_cache_paths", return_value=[temp_maven_repo]
-    ):
-      result = search_maven_source_jars("org.example", "nonexistent", "1.0.0")
+    monkeypatch.setattr(
+      "src.utils.cache_utils.get_maven_cache_paths", lambda: [shared_maven_repo]
+    )
 
-      assert result == []
+    result = search_maven_source_jars("org.example", "nonexistent", "1.0.0")
+
+    assert result == []
 
   def test_search_gradle_source_jars_specific_version(
-    self, temp_gradle_cache: Path
+    self, temp_gradle_cache: Path, monkeypatch: pytest.MonkeyPatch
   ) -> None:
     """Test successful Gradle source JAR search for specific version."""
-    # Create Gradle cache structure
-    gradle_path = (
-      temp_gradle_cache
-      / "modules-2"
-      / "files-2.1"
-      / "org.springframework"
-      / "spring-core"
-      / "5.3.21"
-      / "abc123def456"
-    )
-    gradle_path.mkdir(parents=True, exist_ok=True)
-
-    source_jar = gradle_path / "spring-core-5.3.21-sources.jar"
-    source_jar.write_text("mock jar content")
+    source_jar = _make_gradle_jar(temp_gradle_cache, SPRING_CORE, "5.3.21")
+    expected = os.fspath(source_jar)
 
-    with patch(
-      "src.utils.cache_utils.get_gradle_cache_paths", return_value=[temp_gradle_cache]
-    ):
-      result = search_gradle_source_jars(
-        "org.springframework", "spring-core", "5.3.21"
-      )
+    monkeypatch.setattr(
+      "src.utils.cache_utils.get_gradle_cache_paths", lambda: [temp_gradle_cache]
+    )
 
-      assert len(result) == 1
-      assert result[0] == str(source_jar.absolute())
+    result = search_gradle_source_jars("org.springframework", "spring-core", "5.3.21")
 
-  def test_search_gradle_source_jars_all_versions(
-    self, temp_gradle_cache: Path
-  ) -> None:
-    """Test Gradle source JAR search for all versions."""
-    versions = ["5.3.21", "6.0.0"]
-    expected_jars: list[str] = []
-
-    for version in versions:
-      gradle_path = (
-        temp_gradle_cache
-        / "modules-2"
-        / "files-2.1"
-        / "org.springframework"
-        / "spring-core"
-        / version
-        / f"hash_{version}"
-      )
-      gradle_path.mkdir(parents=True, exist_ok=True)
-      source_jar = gradle_path / f"spring-core-{version}-sources.jar"
-      source_jar.write_text("mock jar content")
-      expected_jars.append(str(source_jar.absolute()))
-
-    with patch(
-      "src.utils.cache_utils.get_gradle_cache_paths", return_value=[temp_gradle_cache]
-    ):
-      result = search_gradle_source_jars("org.springframework", "spring-core", None)
-
-      assert len(result) == 2
-      assert set(result) == set(expected_jars)
+    assert len(result) == 1
+    assert result[0] == expected
 
   def test_search_gradle_source_jars_not_found(
-    self, temp_gradle_cache: Path
+    self, temp_gradle_cache: Path, monkeypatch: pytest.MonkeyPatch
   ) -> None:
     """Test Gradle source JAR not found."""
-    with patch(
-      "src.utils.cache_utils.get_gradle_cache_paths", return_value=[temp_gradle_cache]
-    ):
-      result = search_gradle_source_jars("org.example", "nonexistent", "1.0.0")
+    monkeypatch.setattr(
+      "src.utils.cache_utils.get_gradle_cache_paths", lambda: [temp_gradle_cache]
+    )
+
+    result = search_gradle_source_jars("org.example", "nonexistent", "1.0.0")
 
-      assert result == []
+    assert result == []
 
-  def test_search_cached_artifacts_maven_only(self, temp_maven_repo: Path) -> None:
+  def test_search_cached_artifacts_maven_only(
+    self, shared_maven_repo: Path, monkeypatch: pytest.MonkeyPatch
+  ) -> None:
     """Test searching cached source JAR in Maven only."""
-    # Create Maven source JAR
-    group_path = temp_maven_repo / "org" / "springframework" / "spring-core" / "5.3.21"
-    group_path.mkdir(parents=True, exist_ok=True)
-    source_jar = group_path / "spring-core-5.3.21-sources.jar"
-    source_jar.write_text("mock jar content")
-
-    with patch(
-      "src.utils.cache_utils.get_maven_cache_paths", return_value=[temp_maven_repo]
-    ):
-      result = search_cached_artifacts(
-        "org.springframework", "spring-core", "5.3.21", "maven"
-      )
-
-      assert len(result) == 1
-      assert result[0] == str(source_jar.absolute())
+    source_jar = (
+      shared_maven_repo
+      / "org"
+      / "springframework"
+      / "spring-core"
+      / "5.3.21"
+      / "spring-core-5.3.21-sources.jar"
+    )
+    expected = os.fspath(source_jar)
+
+    monkeypatch.setattr(
+      "src.utils.cache_utils.get_maven_cache_paths", lambda: [shared_maven_repo]
+    )
+
+    result = search_cached_artifacts(
+      "org.springframework", "spring-core", "5.3.21", "maven"
+    )
+
+    assert len(result) == 1
+    assert result[0] == expected
 
   def test_search_cached_artifacts_gradle_only(
-    self, temp_gradle_cache: Path
+    self, temp_gradle_cache: Path, monkeypatch: pytest.MonkeyPatch
   ) -> None:
     """Test searching cached source JAR in Gradle only."""
-    # Create Gradle source JAR
-    gradle_path = (
-      temp_gradle_cache
-      / "modules-2"
-      / "files-2.1"
-      / "org.springframework"
-      / "spring-core"
-      / "5.3.21"
-      / "abc123def456"
+    source_jar = _make_gradle_jar(temp_gradle_cache, SPRING_CORE, "5.3.21")
+    expected = os.fspath(source_jar)
+
+    monkeypatch.setattr(
+      "src.utils.cache_utils.get_gradle_cache_paths", lambda: [temp_gradle_cache]
     )
-    gradle_path.mkdir(parents=True, exist_ok=True)
-    source_jar = gradle_path / "spring-core-5.3.21-sources.jar"
-    source_jar.write_text("mock jar content")
 
-    with patch(
-      "src.utils.cache_utils.get_gradle_cache_paths", return_value=[temp_gradle_cache]
-    ):
-      result = search_cached_artifacts(
-        "org.springframework", "spring-core", "5.3.21", "gradle"
-      )
+    result = search_cached_artifacts(
+      "org.springframework", "spring-core", "5.3.21", "gradle"
+    )
 
-      assert len(result) == 1
-      assert result[0] == str(source_jar.absolute())
+    assert len(result) == 1
+    assert result[0] == expected
 
   def test_search_cached_artifacts_both_caches(
-    self, temp_maven_repo: Path, temp_gradle_cache: Path
+    self,
+    temp_maven_repo: Path,
+    temp_gradle_cache: Path,
+    monkeypatch: pytest.MonkeyPatch,
   ) -> None:
     """Test searching cached source JAR in both caches."""
-    # Create Maven source JAR
-    maven_group_path = (
-      temp_maven_repo / "org" / "springframework" / "spring-core" / "5.3.21"
+    maven_jar = _make_maven_jar(temp_maven_repo, SPRING_CORE, "5.3.21")
+    gradle_jar = _make_gradle_jar(temp_gradle_cache, SPRING_CORE, "5.3.21")
+
+    monkeypatch.setattr(
+      "src.utils.cache_utils.get_maven_cache_paths", lambda: [temp_maven_repo]
     )
-    maven_group_path.mkdir(parents=True, exist_ok=True)
-    maven_jar = maven_group_path / "spring-core-5.3.21-sources.jar"
-    maven_jar.write_text("mock jar content")
-
-    # Create Gradle source JAR
-    gradle_path = (
-      temp_gradle_cache
-      / "modules-2"
-      / "files-2.1"
-      / "org.springframework"
-      / "spring-core"
-      / "5.3.21"
-      / "abc123def456"
+    monkeypatch.setattr(
+      "src.utils.cache_utils.get_gradle_cache_paths", lambda: [temp_gradle_cache]
     )
-    gradle_path.mkdir(parents=True, exist_ok=True)
-    gradle_jar = gradle_path / "spring-core-5.3.21-sources.jar"
-    gradle_jar.write_text("mock jar content")
-
-    with patch(
-      "src.utils.cache_utils.get_maven_cache_paths", return_value=[temp_maven_repo]
-    ), patch(
-      "src.utils.cache_utils.get_gradle_cache_paths", return_value=[temp_gradle_cache]
-    ):
-      result = search_cached_artifacts(
-        "org.springframework", "spring-core", "5.3.21", "maven,gradle"
-      )
-
-      assert len(result) == 2
-      assert str(maven_jar.absolute()) in result
-      assert str(gradle_jar.absolute()) in result
+
+    result = search_cached_artifacts(
+      "org.springframework", "spring-core", "5.3.21", "maven,gradle"
+    )
+
+    assert len(result) == 2
+    assert os.fspath(maven_jar) in result
+    assert os.fspath(gradle_jar) in result
 
   def test_search_cached_artifacts_all_versions(
-    self, temp_maven_repo: Path
+    self, shared_maven_repo: Path, monkeypatch: pytest.MonkeyPatch
   ) -> None:
     """Test searching all cached versions."""
-    versions = ["5.3.21", "6.0.0", "6.0.1"]
-    expected_jars: list[str] = []
-
-    for version in versions:
-      group_path = (
-        temp_maven_repo / "org" / "springframework" / "spring-core" / version
-      )
-      group_path.mkdir(parents=True, exist_ok=True)
-      source_jar = group_path / f"spring-core-{version}-sources.jar"
-      source_jar.write_text("mock jar content")
-      expected_jars.append(str(source_jar.absolute()))
-
-    with patch(
-      "src.utils.cache_utils.get_maven_cache_paths", return_value=[temp_maven_repo]
-    ):
-      result = search_cached_artifacts(
-        "org.springframework", "spring-core", None, "maven"
-      )
-
-      assert len(result) == 3
-      assert set(result) == set(expected_jars)
-
-  def test_search_cached_artifacts_not_found(self) -> None:
-    """Test searching cached source JAR not found."""
-    with patch(
-      "src.utils.cache_utils.get_maven_cache_paths", return_value=[]
-    ), patch("src.utils.cache_utils.get_gradle_cache_paths", return_value=[]):
-      result = search_cached_artifacts(
-        "org.example", "nonexistent", "1.0.0", "maven,gradle"
-      )
-
-      assert result == []
-
-  def test_search_cached_artifacts_invalid_cache_type(self) -> None:
-    """Test searching with invalid cache type."""
+    expected_set = {
+      f"{shared_maven_repo}/org/springframework/spring-core/{version}"
+      f"/spring-core-{version}-sources.jar"
+      for version in SHARED_MAVEN_VERSIONS
+    }
+
+    monkeypatch.setattr(
+      "src.utils.cache_utils.get_maven_cache_paths", lambda: [shared_maven_repo]
+    )
+
     result = search_cached_artifacts(
-      "org.springframework", "spring-core", "5.3.21", "invalid"
+      "org.springframework", "spring-core", None, "maven"
     )
+    result_set = set(result)
 
-    assert result == []
+    assert len(result) == 3
+    assert result_set == expected_set
 
   def test_search_cached_artifacts_deduplication(
-    self, temp_maven_repo: Path
+    self, temp_maven_repo: Path, monkeypatch: pytest.MonkeyPatch
   ) -> None:
     """Test duplicate removal in search results."""
     # Create same JAR in multiple Maven repositories
-    group_path1 = (
-      temp_maven_repo / "org" / "springframework" / "spring-core" / "5.3.21"
+    source_jar1 = _make_maven_jar(temp_maven_repo, SPRING_CORE, "5.3.21")
+    maven_repo2 = temp_maven_repo.parent / "m2_2" / "repository"
+    source_jar2 = maven_repo2 / source_jar1.relative_to(temp_maven_repo)
+    source_jar2.parent.mkdir(parents=True)
+    try:
+      os.link(source_jar1, source_jar2)
+    except OSError:
+      source_jar2.touch()
+
+    monkeypatch.setattr(
+      "src.utils.cache_utils.get_maven_cache_paths",
+      lambda: [temp_maven_repo, maven_repo2],
     )
-    group_path1.mkdir(parents=True, exist_ok=True)
-    source_jar1 = group_path1 / "spring-core-5.3.21-sources.jar"
-    source_jar1.write_text("mock jar content")
 
-    # Create second Maven repo with same structure
-    maven_repo2 = temp_maven_repo.parent / "m2_2" / "repository"
-    group_path2 = (
-      maven_repo2 / "org" / "springframework" / "spring-core" / "5.3.21"
+    result = search_cached_artifacts(
+      "org.springframework", "spring-core", "5.3.21", "maven"
     )
-    group_path2.mkdir(parents=True, exist_ok=True)
-    source_jar2 = group_path2 / "spring-core-5.3.21-sources.jar"
-    source_jar2.write_text("mock jar content")
 
-    with patch(
-      "src.utils.cache_utils.get_maven_cache_paths",
-      return_value=[temp_maven_repo, maven_repo2],
-    ):
-      result = search_cached_artifacts(
-        "org.springframework", "spring-core", "5.3.21", "maven"
-      )
-
-      # Should find both but they are different paths
-      assert len(result) == 2
-      assert str(source_jar1.absolute()) in result
-      assert str(source_jar2.absolute()) in result
\ No newline at end of file
+    # Should find both but they are different paths
+    assert len(result) == 2
+    assert os.fspath(source_jar1) in result
+    assert os.fspath(source_jar2) in result
+
+
+def test_search_cached_artifacts_not_found(monkeypatch: pytest.MonkeyPatch) -> None:
+  """Test searching cached source JAR not found."""
+  monkeypatch.setattr("src.utils.cache_utils.get_maven_cache_paths", lambda: [])
+  monkeypatch.setattr("src.utils.cache_utils.get_gradle_cache_paths", lambda: [])
+
+  result = search_cached_artifacts(
+    "org.example", "nonexistent", "1.0.0", "maven,gradle"
+  )
+
+  assert result == []
+
+
+def test_search_cached_artifacts_invalid_cache_type() -> None:
+  """Test searching with invalid cache type."""
+  result = search_cached_artifacts(
+    "org.springframework", "spring-core", "5.3.21", "invalid"
+  )
+
+  assert result == []
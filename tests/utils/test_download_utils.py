@@ -1,44 +1,72 @@
 # pyright: reportTypedDictNotRequiredAccess=false
 
+import io
+import re
 import zipfile
-import tempfile
 from pathlib import Path
-from typing import Iterator
 from unittest.mock import patch, Mock
 import pytest
 import requests
+import urllib3
 
 from src.utils.download_utils import (
+  URLLIB3_DOWNLOAD_ENV,
   download_file,
   validate_jar_file,
 )
 
+ERR_EMPTY_URL = re.compile("URL cannot be empty")
+ERR_INVALID_URL = re.compile("Invalid URL format")
+ERR_MISSING_TARGET_DIR = re.compile("Target directory does not exist")
+ERR_DOWNLOAD_FAILED = re.compile("Failed to download")
+ERR_JAR_NOT_FOUND = re.compile("JAR file does not exist")
+ERR_NOT_A_FILE = re.compile("Path is not a file")
+ERR_EMPTY_JAR = re.compile("JAR file is empty")
+ERR_INVALID_ZIP = re.compile("Invalid ZIP/JAR file format")
+ERR_CORRUPT_ENTRY = re.compile("JAR file is corrupted at entry: com/example/Test.java")
+
+
+def _mock_session(content: bytes, content_length: int | None = None) -> Mock:
+  """Build a requests.Session stand-in whose GET streams content as one chunk."""
+  mock_response = Mock(spec=["iter_content", "headers", "raise_for_status"])
+  mock_response.iter_content.return_value = [content]
+  mock_response.headers = {
+    "Content-Length": str(len(content) if content_length is None else content_length),
+    "Content-Type": "application/java-archive",
+  }
+  mock_session = Mock()
+  mock_session.get.return_value = mock_response
+  return mock_session
+
+
+def _mock_pool(content: bytes, status: int = 200) -> Mock:
+  """Build a urllib3.PoolManager stand-in whose GET returns a real response."""
+  mock_pool = Mock()
+  mock_pool.request.return_value = urllib3.HTTPResponse(
+    body=io.BytesIO(content),
+    headers={"Content-Length": str(len(content))},
+    status=status,
+    preload_content=False,
+  )
+  return mock_pool
+
+
+@pytest.fixture(scope="module")
+def _root_tmp(tmp_path_factory: pytest.TempPathFactory) -> Path:
+  """Create one temporary directory shared by every test in this module."""
+  return tmp_path_factory.mktemp("download_utils")
+
 
 class TestDownloadFile:
   """Test download_file function."""
 
-  @pytest.fixture
-  def temp_dir(self) -> Iterator[Path]:
-    """Create temporary directory for tests."""
-    with tempfile.TemporaryDirectory() as tmp_dir:
-      yield Path(tmp_dir)
-
   def test_download_file_success(self, temp_dir: Path) -> None:
     """Test successful file download."""
     target_path = temp_dir / "test.jar"
     test_content = b"test content"
 
     with patch("requests.Session") as mock_session_class:
-      mock_session = Mock()
-      mock_session_class.return_value = mock_session
-
-      mock_response = Mock()
-      mock_response.iter_content.return_value = [test_content]
-      mock_response.headers = {
-        "Content-Length": str(len(test_content)),
-        "Content-Type": "application/java-archive",
-      }
-      mock_session.get.return_value = mock_response
+      mock_session_class.return_value = _mock_session(test_content)
 
       result = download_file("https://example.com/test.jar", target_path)
 
@@ -48,25 +76,103 @@ class TestDownloadFile:
       assert result["total_size"] == len(test_content)
       assert target_path.exists()
 
+  def test_download_file_streams_large_chunks(self, temp_dir: Path) -> None:
+    """Test download streams the response body in large chunks."""
+    target_path = temp_dir / "test.jar"
+    mock_response = Mock()
+    mock_response.iter_content.return_value = [b"test content", b""]
+    mock_response.headers = {}
+
+    with patch("requests.Session") as mock_session_class:
+      mock_session_class.return_value.get.return_value = mock_response
+
+      result = download_file("https://example.com/test.jar", target_path)
+
+      mock_session_class.return_value.get.assert_called_once_with(
+        "https://example.com/test.jar", stream=True, timeout=30
+      )
+      (call,) = mock_response.iter_content.call_args_list
+      assert call.kwargs["chunk_size"] >= 65536
+      assert result["downloaded_size"] == len(b"test content")
+
+  def test_download_file_short_body(self, temp_dir: Path) -> None:
+    """Test preallocated space is trimmed when the body is shorter."""
+    target_path = temp_dir / "test.jar"
+    with patch("requests.Session", return_value=_mock_session(b"short", 4096)):
+      result = download_file("https://example.com/test.jar", target_path)
+
+    assert result["downloaded_size"] == 5
+    assert result["total_size"] == 4096
+    assert target_path.read_bytes() == b"short"
+
+  def test_download_file_reads_into_buffer(self, temp_dir: Path) -> None:
+    """Test a real urllib3 body is streamed through a small reused buffer."""
+    target_path = temp_dir / "test.jar"
+    content = bytes(range(256)) * 1000
+    mock_session = _mock_session(content)
+    mock_session.get.return_value.raw = urllib3.HTTPResponse(
+      body=io.BytesIO(content), status=200, preload_content=False
+    )
+
+    with patch("requests.Session", return_value=mock_session):
+      result = download_file(
+        "https://example.com/test.jar", target_path, chunk_size=1000
+      )
+
+    assert result["downloaded_size"] == len(content)
+    assert target_path.read_bytes() == content
+
+  def test_download_file_urllib3_path(
+    self, temp_dir: Path, monkeypatch: pytest.MonkeyPatch
+  ) -> None:
+    """Test download through the urllib3 pool when enabled."""
+    target_path = temp_dir / "test.jar"
+    monkeypatch.setenv(URLLIB3_DOWNLOAD_ENV, "1")
+    monkeypatch.setattr(
+      "src.utils.download_utils._get_pool", Mock(return_value=_mock_pool(b"pooled"))
+    )
+
+    result = download_file("https://example.com/test.jar", target_path)
+
+    assert result["downloaded_size"] == len(b"pooled")
+    assert result["content_type"] == "unknown"
+    assert target_path.read_bytes() == b"pooled"
+
+  def test_download_file_urllib3_http_error(
+    self, temp_dir: Path, monkeypatch: pytest.MonkeyPatch
+  ) -> None:
+    """Test urllib3 path raises RequestException on HTTP errors."""
+    target_path = temp_dir / "test.jar"
+    monkeypatch.setenv(URLLIB3_DOWNLOAD_ENV, "1")
+    monkeypatch.setattr(
+      "src.utils.download_utils._get_pool",
+      Mock(return_value=_mock_pool(b"", status=404)),
+    )
+
+    with pytest.raises(requests.RequestException, match=ERR_DOWNLOAD_FAILED):
+      download_file("https://example.com/test.jar", target_path)
+
+    assert not target_path.exists()
+
   def test_download_file_empty_url(self, temp_dir: Path) -> None:
     """Test download with empty URL."""
     target_path = temp_dir / "test.jar"
 
-    with pytest.raises(ValueError, match="URL cannot be empty"):
+    with pytest.raises(ValueError, match=ERR_EMPTY_URL):
       download_file("", target_path)
 
   def test_download_file_invalid_url(self, temp_dir: Path) -> None:
     """Test download with invalid URL format."""
     target_path = temp_dir / "test.jar"
 
-    with pytest.raises(ValueError, match="Invalid URL format"):
+    with pytest.raises(ValueError, match=ERR_INVALID_URL):
       download_file("not-a-url", target_path)
 
   def test_download_file_nonexistent_target_dir(self) -> None:
     """Test download to nonexistent directory."""
     target_path = Path("/nonexistent/test.jar")
 
-    with pytest.raises(ValueError, match="Target directory does not exist"):
+    with pytest.raises(ValueError, match=ERR_MISSING_TARGET_DIR):
       download_file("https://example.com/test.jar", target_path)
 
   def test_download_file_request_failure(self, temp_dir: Path) -> None:
@@ -78,7 +184,7 @@ class TestDownloadFile:
       mock_session_class.return_value = mock_session
       mock_session.get.side_effect = requests.RequestException("Network error")
 
-      with pytest.raises(requests.RequestException, match="Failed to download"):
+      with pytest.raises(requests.RequestException, match=ERR_DOWNLOAD_FAILED):
         download_file("https://example.com/test.jar", target_path)
 
       assert not target_path.exists()  # Should clean up partial download
@@ -87,33 +193,25 @@ class TestDownloadFile:
 class TestValidateJarFile:
   """Test validate_jar_file function."""
 
-  @pytest.fixture
-  def temp_dir(self) -> Iterator[Path]:
-    """Create temporary directory for tests."""
-    with tempfile.TemporaryDirectory() as tmp_dir:
-      yield Path(tmp_dir)
-
-  @pytest.fixture
-  def valid_jar(self, temp_dir: Path) -> Path:
+  @pytest.fixture(scope="module")
+  def valid_jar(self, _root_tmp: Path) -> Path:
     """Create a valid JAR file for testing."""
-    jar_path = temp_dir / "test.jar"
+    jar_path = _root_tmp / "test.jar"
 
-    with zipfile.ZipFile(jar_path, "w") as jar_zip:
+    with zipfile.ZipFile(jar_path, "w", compression=zipfile.ZIP_STORED) as jar_zip:
       jar_zip.writestr("META-INF/MANIFEST.MF", "Manifest-Version: 1.0\n")
-      jar_zip.writestr(
-        "com/example/Test.java", "package com.example;\npublic class Test {}"
-      )
+      jar_zip.writestr("com/example/Test.java", "")
 
     return jar_path
 
-  @pytest.fixture
-  def binary_jar(self, temp_dir: Path) -> Path:
+  @pytest.fixture(scope="module")
+  def binary_jar(self, _root_tmp: Path) -> Path:
     """Create a binary JAR file for testing."""
-    jar_path = temp_dir / "binary.jar"
+    jar_path = _root_tmp / "binary.jar"
 
-    with zipfile.ZipFile(jar_path, "w") as jar_zip:
+    with zipfile.ZipFile(jar_path, "w", compression=zipfile.ZIP_STORED) as jar_zip:
       jar_zip.writestr("META-INF/MANIFEST.MF", "Manifest-Version: 1.0\n")
-      jar_zip.writestr("com/example/Test.class", "dummy class file content")
+      jar_zip.writestr("com/example/Test.class", b"")
 
     return jar_path
 
@@ -138,14 +236,63 @@ class TestValidateJarFile:
     assert result["class_files"] == 1
     assert result["is_source_jar"] is False
 
+  def test_validate_large_jar(self, temp_dir: Path) -> None:
+    """Test validation counts every entry of a JAR with many entries."""
+    jar_path = temp_dir / "large.jar"
+
+    with zipfile.ZipFile(jar_path, "w", compression=zipfile.ZIP_STORED) as jar_zip:
+      jar_zip.writestr("META-INF/MANIFEST.MF", "Manifest-Version: 1.0\n")
+      for i in range(10_000):
+        jar_zip.writestr(f"com/example/Test{i}.java", "")
+
+    result = validate_jar_file(jar_path)
+
+    assert result["total_entries"] == 10_001
+    assert result["java_files"] == 10_000
+    assert result["class_files"] == 0
+    assert result["has_manifest"] is True
+    assert result["is_source_jar"] is True
+
+  def test_validate_jar_without_manifest(self, temp_dir: Path) -> None:
+    """Test validation reports a missing manifest."""
+    jar_path = temp_dir / "no-manifest.jar"
+
+    with zipfile.ZipFile(jar_path, "w", compression=zipfile.ZIP_STORED) as jar_zip:
+      jar_zip.writestr("META-INF/", "")
+      jar_zip.writestr("com/example/Test.java", "")
+
+    result = validate_jar_file(jar_path)
+
+    assert result["total_entries"] == 2
+    assert result["has_manifest"] is False
+
+  def test_validate_jar_deep_detects_corruption(self, temp_dir: Path) -> None:
+    """Test deep validation catches entry data that fails its CRC check."""
+    jar_path = temp_dir / "corrupt.jar"
+    with zipfile.ZipFile(jar_path, "w", compression=zipfile.ZIP_STORED) as jar_zip:
+      jar_zip.writestr("META-INF/MANIFEST.MF", "Manifest-Version: 1.0\n")
+      jar_zip.writestr("com/example/Test.java", "class Test { int marker; }")
+    data = jar_path.read_bytes()
+    jar_path.write_bytes(data.replace(b"marker", b"MARKER"))
+
+    with pytest.raises(ValueError, match=ERR_CORRUPT_ENTRY):
+      validate_jar_file(jar_path, deep=True)
+
+  def test_validate_jar_deep_success(self, valid_jar: Path) -> None:
+    """Test deep validation of an intact JAR file."""
+    result = validate_jar_file(valid_jar, deep=True)
+
+    assert result["status"] == "valid"
+    assert result["total_entries"] == 2
+
   def test_validate_jar_nonexistent_file(self) -> None:
     """Test validation of nonexistent file."""
-    with pytest.raises(ValueError, match="JAR file does not exist"):
+    with pytest.raises(ValueError, match=ERR_JAR_NOT_FOUND):
       validate_jar_file(Path("/nonexistent.jar"))
 
   def test_validate_jar_directory(self, temp_dir: Path) -> None:
     """Test validation of directory instead of file."""
-    with pytest.raises(ValueError, match="Path is not a file"):
+    with pytest.raises(ValueError, match=ERR_NOT_A_FILE):
       validate_jar_file(temp_dir)
 
   def test_validate_jar_empty_file(self, temp_dir: Path) -> None:
@@ -153,7 +300,7 @@ class TestValidateJarFile:
     empty_jar = temp_dir / "empty.jar"
     empty_jar.touch()
 
-    with pytest.raises(ValueError, match="JAR file is empty"):
+    with pytest.raises(ValueError, match=ERR_EMPTY_JAR):
       validate_jar_file(empty_jar)
 
   def test_validate_jar_invalid_zip(self, temp_dir: Path) -> None:
@@ -161,5 +308,31 @@ class TestValidateJarFile:
     invalid_jar = temp_dir / "invalid.jar"
     invalid_jar.write_text("not a zip file")
 
-    with pytest.raises(ValueError, match="Invalid ZIP/JAR file format"):
+    with pytest.raises(ValueError, match=ERR_INVALID_ZIP):
       validate_jar_file(invalid_jar)
+
+  def test_validate_jar_with_launcher_stub(self, temp_dir: Path) -> None:
+    """Test a JAR with a prepended launcher script is still accepted."""
+    jar_path = temp_dir / "launcher.jar"
+    with zipfile.ZipFile(jar_path, "w", compression=zipfile.ZIP_STORED) as jar_zip:
+      jar_zip.writestr("META-INF/MANIFEST.MF", "Manifest-Version: 1.0\n")
+      jar_zip.writestr("com/example/Test.java", "class Test {}")
+    jar_path.write_bytes(b'#!/bin/sh\nexec java -jar $0 "$@"\n' + jar_path.read_bytes())
+
+    result = validate_jar_file(jar_path, deep=True)
+
+    assert result["status"] == "valid"
+    assert result["total_entries"] == 2
+
+  def test_validate_jar_rejects_non_zip_magic(self, temp_dir: Path) -> None:
+    """Test non-ZIP content is rejected without opening a ZipFile."""
+    blob = temp_dir / "blob.jar"
+    with open(blob, "wb") as f:
+      f.write(b"\x00" * 4)
+      f.truncate(50 * 1024 * 1024)
+
+    with patch("src.utils.download_utils.zipfile.ZipFile") as mock_zipfile:
+      with pytest.raises(ValueError, match=ERR_INVALID_ZIP):
+        validate_jar_file(blob)
+
+      mock_zipfile.assert_not_called()
@@ -1,9 +1,7 @@
 # pyright: reportTypedDictNotRequiredAccess=false
 
 import zipfile
-import tempfile
 from pathlib import Path
-from typing import Iterator
 from unittest.mock import patch, Mock
 import pytest
 import requests
@@ -18,12 +16,6 @@ from src.utils.path_utils import ensure_directory
 class TestDownloadFile:
   """Test download_file function."""
 
-  @pytest.fixture
-  def temp_dir(self) -> Iterator[Path]:
-    """Create temporary directory for tests."""
-    with tempfile.TemporaryDirectory() as tmp_dir:
-      yield Path(tmp_dir)
-
   def test_download_file_success(self, temp_dir: Path) -> None:
     """Test successful file download."""
     target_path = temp_dir / "test.jar"
@@ -88,12 +80,6 @@ class TestDownloadFile:
 class TestValidateJarFile:
   """Test validate_jar_file function."""
 
-  @pytest.fixture
-  def temp_dir(self) -> Iterator[Path]:
-    """Create temporary directory for tests."""
-    with tempfile.TemporaryDirectory() as tmp_dir:
-      yield Path(tmp_dir)
-
   @pytest.fixture
   def valid_jar(self, temp_dir: Path) -> Path:
     """Create a valid JAR file for testing."""
@@ -169,12 +155,6 @@ class TestValidateJarFile:
 class TestSafeCopyFile:
   """Test safe_copy_file function."""
 
-  @pytest.fixture
-  def temp_dir(self) -> Iterator[Path]:
-    """Create temporary directory for tests."""
-    with tempfile.TemporaryDirectory() as tmp_dir:
-      yield Path(tmp_dir)
-
   def test_safe_copy_file_success(self, temp_dir: Path) -> None:
     """Test successful file copy."""
     source_file = temp_dir / "source.txt"
@@ -235,12 +215,6 @@ class TestSafeCopyFile:
 class TestSafeSymlink:
   """Test safe_symlink function."""
 
-  @pytest.fixture
-  def temp_dir(self) -> Iterator[Path]:
-    """Create temporary directory for tests."""
-    with tempfile.TemporaryDirectory() as tmp_dir:
-      yield Path(tmp_dir)
-
   def test_safe_symlink_success(self, temp_dir: Path) -> None:
     """Test successful symlink creation."""
     source_file = temp_dir / "source.txt"
@@ -291,12 +265,6 @@ class TestSafeSymlink:
 class TestSafeCopyTree:
   """Test safe_copy_tree function."""
 
-  @pytest.fixture
-  def temp_dir(self) -> Iterator[Path]:
-    """Create temporary directory for tests."""
-    with tempfile.TemporaryDirectory() as tmp_dir:
-      yield Path(tmp_dir)
-
   def test_safe_copy_tree_success(self, temp_dir: Path) -> None:
     """Test successful directory tree copy."""
     source_dir = temp_dir / "source"
@@ -339,12 +307,6 @@ class TestSafeCopyTree:
 class TestGetFileInfo:
   """Test get_file_info function."""
 
-  @pytest.fixture
-  def temp_dir(self) -> Iterator[Path]:
-    """Create temporary directory for tests."""
-    with tempfile.TemporaryDirectory() as tmp_dir:
-      yield Path(tmp_dir)
-
   def test_get_file_info_file(self, temp_dir: Path) -> None:
     """Test file info for a regular file (Phase 1 API)."""
     test_file = temp_dir / "test.txt"
@@ -391,12 +353,6 @@ class TestGetFileInfo:
 class TestEnsureDirectory:
   """Test ensure_directory function."""
 
-  @pytest.fixture
-  def temp_dir(self) -> Iterator[Path]:
-    """Create temporary directory for tests."""
-    with tempfile.TemporaryDirectory() as tmp_dir:
-      yield Path(tmp_dir)
-
   def test_ensure_directory_create_new(self, temp_dir: Path) -> None:
     """Test creating a new directory."""
     new_dir = temp_dir / "new_dir"
@@ -1,10 +1,12 @@
 """Test filesystem exploration utilities."""
 
-import tempfile
+import re
 from pathlib import Path
-from typing import Iterator
+from types import SimpleNamespace
+from typing import Any, Callable, List
 import pytest
 
+from src.utils import filesystem_exploration
 from src.utils.filesystem_exploration import (
   get_file_info,
   list_directory_tree,
@@ -18,12 +20,6 @@ from src.utils.filesystem_exploration import (
 class TestGetFileInfo:
   """Test get_file_info function."""
 
-  @pytest.fixture
-  def temp_dir(self) -> Iterator[Path]:
-    """Create temporary directory for tests."""
-    with tempfile.TemporaryDirectory() as tmp_dir:
-      yield Path(tmp_dir)
-
   def test_get_file_info_text_file(self, temp_dir: Path) -> None:
     """Test file info for a text file."""
     test_file = temp_dir / "test.txt"
@@ -35,6 +31,55 @@ class TestGetFileInfo:
     assert info["line_count"] == 3
     assert "B" in info["size"] or "KB" in info["size"]
 
+  def test_get_file_info_trailing_newline(self, temp_dir: Path) -> None:
+    """Test a trailing newline does not add an extra line."""
+    test_file = temp_dir / "test.txt"
+    test_file.write_bytes(b"line 1\r\nline 2\r\nline 3\n")
+
+    info = get_file_info(str(test_file))
+
+    assert info["line_count"] == 3
+
+  def test_get_file_info_carriage_returns(self, tmp_path: Path) -> None:
+    """Test lone CR line endings are counted like get_file_content splits them."""
+    (tmp_path / "mac.txt").write_bytes(b"line 1\rline 2\r\nline 3")
+
+    info = get_file_info(str(tmp_path / "mac.txt"))
+    result = get_file_content(str(tmp_path), "mac.txt")
+
+    assert info["line_count"] == 3
+    assert result["content"]["end_line"] == 3
+
+  def test_get_file_info_crlf_across_read_chunks(self, temp_dir: Path) -> None:
+    """Test a CRLF split across read chunks ends a single line."""
+    test_file = temp_dir / "crlf.txt"
+    # The 8 KiB head ends in "\r" and the next read starts with "\n"
+    test_file.write_bytes(b"x" * 8191 + b"\r\nlast")
+
+    info = get_file_info(str(test_file))
+
+    assert info["line_count"] == 2
+
+  def test_get_file_info_spans_read_chunks(self, temp_dir: Path) -> None:
+    """Test lines are counted across multiple read chunks."""
+    test_file = temp_dir / "large.txt"
+    # 40-byte lines, so chunk boundaries fall mid-line; no trailing newline
+    test_file.write_bytes(b"\n".join([b"x" * 39] * 60_000))
+
+    info = get_file_info(str(test_file))
+
+    assert info["line_count"] == 60_000
+
+  def test_get_file_info_large_file(self, temp_dir: Path) -> None:
+    """Test lines are counted across several read chunks of a large file."""
+    test_file = temp_dir / "large.txt"
+    # 5 MiB of 64-byte lines, with a final line missing its newline
+    test_file.write_bytes((b"x" * 63 + b"\n") * 81_920 + b"tail")
+
+    info = get_file_info(str(test_file))
+
+    assert info["line_count"] == 81_921
+
   def test_get_file_info_empty_file(self, temp_dir: Path) -> None:
     """Test file info for an empty file."""
     empty_file = temp_dir / "empty.txt"
@@ -137,6 +182,22 @@ class TestListDirectoryTree:
     assert len(result["files"]) == 0
     assert len(result["folders"]) == 2
 
+  @pytest.mark.parametrize("include_files", [True, False])
+  def test_list_directory_tree_broken_links(
+    self, sample_directory: Path, include_files: bool
+  ) -> None:
+    """Test symlink loops and dangling links are skipped and not counted."""
+    subdir2 = sample_directory / "subdir2"
+    (subdir2 / "loop").symlink_to(subdir2 / "loop")
+    (subdir2 / "dangling").symlink_to(subdir2 / "missing.java")
+
+    result = list_directory_tree(str(sample_directory), include_files=include_files)
+
+    subdir2_info = next(f for f in result["folders"] if f["name"] == "subdir2")
+    assert subdir2_info["file_count"] == 1
+    if include_files:
+      assert [f["name"] for f in subdir2_info["files"]] == ["nested2.java"]
+
   def test_list_directory_tree_nonexistent_start(self, sample_directory: Path) -> None:
     """Test directory tree with nonexistent start path."""
     with pytest.raises(ValueError, match="Start path does not exist"):
@@ -193,6 +254,14 @@ class TestGetFileContent:
     assert "Line 5" in result["content"]["source_code"]
     assert "Line 1" not in result["content"]["source_code"]
 
+  def test_get_file_content_end_line_past_eof(self, base_dir: Path) -> None:
+    """Test an end line past the end of the file is clamped."""
+    result = get_file_content(str(base_dir), "sample.txt", start_line=4, end_line=99)
+
+    assert result["content"]["start_line"] == 4
+    assert result["content"]["end_line"] == 5
+    assert result["content"]["source_code"] == "Line 4\nLine 5\n"
+
   def test_get_file_content_nonexistent_file(self, base_dir: Path) -> None:
     """Test reading nonexistent file."""
     with pytest.raises(FileNotFoundError, match="File does not exist"):
@@ -267,6 +336,17 @@ class TestSearchFilesByPattern:
     assert len(result["files"]) == 1
     assert result["files"][0]["name"] == "Test.java"
 
+  def test_search_files_by_pattern_relative_paths(self, sample_directory: Path) -> None:
+    """Test matched files report paths relative to the base path."""
+    result = search_files_by_pattern(str(sample_directory), "*.java", "glob")
+    paths = {f["path"] for f in result["files"]}
+    assert paths == {"Test.java", "Utils.java", "com/example/Main.java"}
+
+    result = search_files_by_pattern(
+      str(sample_directory), "*.java", "glob", start_path="com"
+    )
+    assert [f["path"] for f in result["files"]] == ["com/example/Main.java"]
+
   def test_search_files_by_pattern_start_path(self, sample_directory: Path) -> None:
     """Test searching from specific start path."""
     result = search_files_by_pattern(
@@ -279,6 +359,38 @@ class TestSearchFilesByPattern:
     assert "Test.java" not in file_names
 
 
+class _FakeHyperscanDatabase:
+  """Hyperscan Database stand-in that scans the whole buffer with re."""
+
+  scanned: List[bytes] = []
+
+  def compile(
+    self, expressions: List[bytes], ids: List[int], elements: int, flags: List[int]
+  ) -> None:
+    self.pattern = re.compile(expressions[0], re.MULTILINE)
+
+  def scan(self, data: bytes, match_event_handler: Callable[..., None]) -> None:
+    self.scanned.append(data)
+    for m in self.pattern.finditer(data):
+      match_event_handler(0, m.start(), m.end(), 0, None)
+
+
+@pytest.fixture
+def fake_hyperscan(monkeypatch: pytest.MonkeyPatch) -> Any:
+  """Install a fake hyperscan module so the prefilter branch runs."""
+  fake = SimpleNamespace(
+    Database=_FakeHyperscanDatabase,
+    HS_FLAG_SOM_LEFTMOST=1,
+    HS_FLAG_MULTILINE=2,
+    error=RuntimeError,
+  )
+  _FakeHyperscanDatabase.scanned = []
+  monkeypatch.setattr(filesystem_exploration, "hyperscan", fake)
+  filesystem_exploration._compile_hyperscan.cache_clear()
+  yield fake
+  filesystem_exploration._compile_hyperscan.cache_clear()
+
+
 class TestSearchFileContents:
   """Test search_file_contents function."""
 
@@ -340,6 +452,83 @@ class TestSearchFileContents:
 
     assert found_classes
 
+  def test_search_file_contents_regex_stays_within_lines(self, tmp_path: Path) -> None:
+    """Test regex matches are reported per line and never span lines."""
+    (tmp_path / "Split.java").write_text(
+      "public\nclass Split {}\n// public class Comment\n"
+    )
+
+    result = search_file_contents(str(tmp_path), r"public\s+class", "regex")
+
+    matches = result["matches"]["Split.java"]
+    assert [m["match_lines"] for m in matches] == ["3"]
+
+  def test_search_file_contents_regex_hyperscan_prefilter(
+    self, tmp_path: Path, fake_hyperscan: Any
+  ) -> None:
+    """Test regex candidates come from the Hyperscan scan when available."""
+    (tmp_path / "Split.java").write_text(
+      "public\nclass Split {}\n// public class Comment\n"
+    )
+
+    result = search_file_contents(str(tmp_path), r"public\s+class", "regex")
+
+    assert len(_FakeHyperscanDatabase.scanned) == 1
+    matches = result["matches"]["Split.java"]
+    assert [m["match_lines"] for m in matches] == ["3"]
+
+  def test_search_file_contents_regex_string_anchor_skips_hyperscan(
+    self, tmp_path: Path, fake_hyperscan: Any
+  ) -> None:
+    """Test \\A anchors every line, as re does, rather than only the file start."""
+    (tmp_path / "Anchors.java").write_text("public class A {}\npublic class B {}\n")
+
+    result = search_file_contents(str(tmp_path), r"\Apublic", "regex")
+
+    assert _FakeHyperscanDatabase.scanned == []
+    matches = result["matches"]["Anchors.java"]
+    assert [m["match_lines"] for m in matches] == ["1", "2"]
+
+  def test_search_file_contents_string_line_numbers(self, tmp_path: Path) -> None:
+    """Test string matches report the lines they occur on."""
+    (tmp_path / "Lines.java").write_text("foo\nbar foo\nbaz\nfoofoo\n")
+
+    result = search_file_contents(str(tmp_path), "foo", "string")
+    matches = result["matches"]["Lines.java"]
+    assert [m["match_lines"] for m in matches] == ["1", "2", "4"]
+
+    result = search_file_contents(str(tmp_path), "foo\nbar", "string")
+    assert result["matches"] == {}
+
+  def test_search_file_contents_relative_paths(self, tmp_path: Path) -> None:
+    """Test matches are keyed by paths relative to the base path."""
+    nested = tmp_path / "com" / "example"
+    nested.mkdir(parents=True)
+    (nested / "Main.java").write_text("class Main {}\n")
+    (tmp_path / "Root.java").write_text("class Root {}\n")
+
+    result = search_file_contents(str(tmp_path), "class", "string")
+    assert set(result["matches"]) == {"Root.java", "com/example/Main.java"}
+
+    result = search_file_contents(str(tmp_path), "class", "string", start_path="com")
+    assert set(result["matches"]) == {"com/example/Main.java"}
+
+  def test_search_file_contents_skips_binary(self, tmp_path: Path) -> None:
+    """Test binary files are not searched."""
+    (tmp_path / "Test.class").write_bytes(b"\xca\xfe\xba\xbe\x00\x00Hello\n")
+    (tmp_path / "Test.java").write_text("Hello\n")
+
+    result = search_file_contents(str(tmp_path), "Hello", "string")
+
+    assert set(result["matches"]) == {"Test.java"}
+
+  def test_search_file_contents_invalid_regex(self, sample_directory: Path) -> None:
+    """Test an invalid regex query matches nothing."""
+    result = search_file_contents(str(sample_directory), "public (", "regex")
+
+    assert result["search_config"]["query_type"] == "regex"
+    assert result["matches"] == {}
+
   def test_search_file_contents_with_context(self, sample_directory: Path) -> None:
     """Test searching with context lines."""
     result = search_file_contents(
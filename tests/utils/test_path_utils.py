@@ -1,8 +1,8 @@
 """Test path utilities."""
 
-import tempfile
+import os
 from pathlib import Path
-from typing import Iterator
+from unittest.mock import patch
 import pytest
 
 from src.utils.path_utils import (
@@ -28,6 +28,27 @@ class TestNormalizePath:
     result = normalize_path(abs_path)
     assert Path(result).is_absolute()
 
+  def test_normalize_path_absolute_skips_cwd(self) -> None:
+    """Test absolute paths are normalized without consulting the cwd."""
+    with patch("os.getcwd", side_effect=AssertionError("getcwd called")):
+      result = normalize_path("/usr/local/../bin/./java")
+
+    assert result == os.path.normpath("/usr/bin/java")
+
+  def test_normalize_path_follows_cwd(
+    self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+  ) -> None:
+    """Test cached results are keyed on the working directory."""
+    first = tmp_path / "first"
+    second = tmp_path / "second"
+    first.mkdir()
+    second.mkdir()
+
+    monkeypatch.chdir(first)
+    assert normalize_path("src/../pkg") == os.path.join(os.getcwd(), "pkg")
+    monkeypatch.chdir(second)
+    assert normalize_path("src/../pkg") == os.path.join(os.getcwd(), "pkg")
+
   def test_normalize_path_empty(self) -> None:
     """Test normalization with empty string."""
     with pytest.raises(ValueError, match="Path must be a non-empty string"):
@@ -55,21 +76,25 @@ class TestCalculateDirectoryDepth:
     depth = calculate_directory_depth(base_path, target_path)
     assert depth == 0
 
-  def test_calculate_directory_depth_subdirectory(self) -> None:
-    """Test depth calculation for subdirectory."""
-    base_path = "/home/user"
-    target_path = "/home/user/documents/projects"
-
-    depth = calculate_directory_depth(base_path, target_path)
-    assert depth == 2
-
-  def test_calculate_directory_depth_single_level(self) -> None:
-    """Test depth calculation for single level."""
-    base_path = "/home/user"
-    target_path = "/home/user/documents"
-
-    depth = calculate_directory_depth(base_path, target_path)
-    assert depth == 1
+  def test_calculate_directory_depth_same_path_after_normalization(self) -> None:
+    """Test spellings that normalize to the base path have depth 0."""
+    assert calculate_directory_depth("/home/user/", "/home/./user") == 0
+    assert calculate_directory_depth("/", "/") == 0
+
+  @pytest.mark.parametrize(
+    ("target_path", "expected"),
+    [
+      ("/home/user/documents", 1),
+      ("/home/user/documents/projects", 2),
+      ("/home/user/project/src", 2),
+    ],
+  )
+  def test_calculate_directory_depth_subdirectory(
+    self, target_path: str, expected: int
+  ) -> None:
+    """Test depth calculation for subdirectories."""
+    depth = calculate_directory_depth("/home/user", target_path)
+    assert depth == expected
 
   def test_calculate_directory_depth_not_under_base(self) -> None:
     """Test depth calculation when target is not under base."""
@@ -79,16 +104,19 @@ class TestCalculateDirectoryDepth:
     with pytest.raises(ValueError, match="Target path is not under base path"):
       calculate_directory_depth(base_path, target_path)
 
+  def test_calculate_directory_depth_sibling_with_shared_prefix(self) -> None:
+    """Test a sibling whose name extends the base name is not under base."""
+    with pytest.raises(ValueError, match="Target path is not under base path"):
+      calculate_directory_depth("/home/user", "/home/user2/documents")
+
+  def test_calculate_directory_depth_from_root(self) -> None:
+    """Test depth calculation when the base is the filesystem root."""
+    assert calculate_directory_depth("/", "/home/user") == 2
+
 
 class TestEnsureDirectory:
   """Test ensure_directory function."""
 
-  @pytest.fixture
-  def temp_dir(self) -> Iterator[Path]:
-    """Create temporary directory for tests."""
-    with tempfile.TemporaryDirectory() as tmp_dir:
-      yield Path(tmp_dir)
-
   def test_ensure_directory_create_new(self, temp_dir: Path) -> None:
     """Test creating a new directory."""
     new_dir = temp_dir / "new_dir"
@@ -1,13 +1,16 @@
 """Test source extraction utilities."""
 
-import tempfile
+import io
+import os
+import shutil
+import subprocess
 import zipfile
 from pathlib import Path
-from typing import Iterator
 from unittest.mock import patch, Mock, MagicMock
 import pytest
 
 from src.utils.source_extraction import (
+  _BUFPOOL,
   extract_jar_source,
   copy_directory_source,
   safe_copy_file,
@@ -17,30 +20,49 @@ from src.utils.source_extraction import (
 )
 
 
-class TestExtractJarSource:
-  """Test extract_jar_source function."""
+@pytest.fixture(scope="session")
+def source_jar_template(tmp_path_factory: pytest.TempPathFactory) -> Path:
+  """Build the shared source JAR once per session."""
+  jar_path = tmp_path_factory.mktemp("source_jar") / "source.jar"
 
-  @pytest.fixture
-  def temp_dir(self) -> Iterator[Path]:
-    """Create temporary directory for tests."""
-    with tempfile.TemporaryDirectory() as tmp_dir:
-      yield Path(tmp_dir)
+  with zipfile.ZipFile(jar_path, "w") as jar_zip:
+    jar_zip.writestr("META-INF/MANIFEST.MF", "Manifest-Version: 1.0\n")
+    jar_zip.writestr(
+      "com/example/Test.java", "package com.example;\npublic class Test {}"
+    )
+    jar_zip.writestr(
+      "com/example/Utils.java", "package com.example;\npublic class Utils {}"
+    )
 
-  @pytest.fixture
-  def source_jar(self, temp_dir: Path) -> Path:
-    """Create a source JAR file for testing."""
-    jar_path = temp_dir / "source.jar"
+  return jar_path
 
-    with zipfile.ZipFile(jar_path, "w") as jar_zip:
-      jar_zip.writestr("META-INF/MANIFEST.MF", "Manifest-Version: 1.0\n")
-      jar_zip.writestr(
-        "com/example/Test.java", "package com.example;\npublic class Test {}"
-      )
-      jar_zip.writestr(
-        "com/example/Utils.java", "package com.example;\npublic class Utils {}"
-      )
 
-    return jar_path
+@pytest.fixture(scope="session")
+def source_tree_template(tmp_path_factory: pytest.TempPathFactory) -> Path:
+  """Build the shared two-level source tree once per session."""
+  source_dir = tmp_path_factory.mktemp("source_tree") / "source"
+
+  source_dir.mkdir()
+  (source_dir / "file1.txt").write_text("content1")
+  (source_dir / "subdir").mkdir()
+  (source_dir / "subdir" / "file2.txt").write_text("content2")
+
+  return source_dir
+
+
+@pytest.fixture
+def source_tree(temp_dir: Path, source_tree_template: Path) -> Path:
+  """Copy the shared source tree into the test's temp directory."""
+  return Path(shutil.copytree(source_tree_template, temp_dir / "source"))
+
+
+class TestExtractJarSource:
+  """Test extract_jar_source function."""
+
+  @pytest.fixture
+  def source_jar(self, temp_dir: Path, source_jar_template: Path) -> Path:
+    """Copy the shared source JAR into the test's temp directory."""
+    return Path(shutil.copyfile(source_jar_template, temp_dir / "source.jar"))
 
   def test_extract_jar_source_success(self, temp_dir: Path, source_jar: Path) -> None:
     """Test successful JAR extraction."""
@@ -53,6 +75,181 @@ class TestExtractJarSource:
     assert (target_dir / "com" / "example" / "Test.java").exists()
     assert (target_dir / "com" / "example" / "Utils.java").exists()
 
+  def test_extract_jar_source_large_entry(self, temp_dir: Path) -> None:
+    """Test an entry larger than the copy buffer is extracted intact."""
+    jar_path = temp_dir / "large.jar"
+    content = os.urandom(600 * 1024)
+    with zipfile.ZipFile(jar_path, "w", zipfile.ZIP_DEFLATED) as jar_zip:
+      jar_zip.writestr("com/example/", "")
+      jar_zip.writestr("com/example/Large.bin", content)
+    target_dir = temp_dir / "extracted"
+
+    extract_jar_source(str(jar_path), str(target_dir))
+
+    assert (target_dir / "com" / "example" / "Large.bin").read_bytes() == content
+
+  def test_extract_jar_source_preallocates_large_entries(self, temp_dir: Path) -> None:
+    """Test entries over 1 MiB are preallocated and extracted intact."""
+    jar_path = temp_dir / "large.jar"
+    content = os.urandom(2 * 1024 * 1024)
+    with zipfile.ZipFile(jar_path, "w", zipfile.ZIP_DEFLATED) as jar_zip:
+      jar_zip.writestr("Small.java", "class Small {}")
+      jar_zip.writestr("lib/native.so", content)
+    target_dir = temp_dir / "extracted"
+
+    with patch(
+      "src.utils.source_extraction.os.posix_fallocate", wraps=os.posix_fallocate
+    ) as mock_fallocate:
+      extract_jar_source(str(jar_path), str(target_dir))
+
+    mock_fallocate.assert_called_once()
+    assert mock_fallocate.call_args.args[1:] == (0, len(content))
+    assert (target_dir / "lib" / "native.so").read_bytes() == content
+    assert (target_dir / "Small.java").read_text() == "class Small {}"
+
+  def test_extract_jar_source_creates_each_directory_once(self, temp_dir: Path) -> None:
+    """Test directories shared by many entries are created only once."""
+    jar_path = temp_dir / "shared.jar"
+    with zipfile.ZipFile(jar_path, "w") as jar_zip:
+      jar_zip.writestr("com/example/", "")
+      for i in range(50):
+        jar_zip.writestr(f"com/example/Test{i}.java", f"class Test{i} {{}}")
+    target_dir = temp_dir / "extracted"
+
+    with patch(
+      "src.utils.source_extraction.os.makedirs", wraps=os.makedirs
+    ) as mock_makedirs:
+      extract_jar_source(str(jar_path), str(target_dir))
+
+    # os.makedirs recurses into itself for missing parents, so only count
+    # requests for the shared package directory
+    package_dir = os.path.join(str(target_dir), "com", "example")
+    package_calls = [
+      c for c in mock_makedirs.call_args_list if c.args[0] == package_dir
+    ]
+    assert len(package_calls) == 1
+    assert len(list((target_dir / "com" / "example").iterdir())) == 50
+
+  def test_extract_jar_source_reuses_copy_buffers(
+    self, temp_dir: Path, source_jar: Path
+  ) -> None:
+    """Test copy buffers return to the shared pool after extraction."""
+    extract_jar_source(str(source_jar), str(temp_dir / "first"))
+    pooled = _BUFPOOL.qsize()
+
+    extract_jar_source(str(source_jar), str(temp_dir / "second"))
+
+    assert pooled >= 1
+    assert _BUFPOOL.qsize() == pooled
+
+  def test_extract_jar_source_reads_through_buffer(
+    self, temp_dir: Path, source_jar: Path
+  ) -> None:
+    """Test the JAR is read once through a large buffered reader."""
+    target = temp_dir / "extracted"
+
+    with patch(
+      "src.utils.source_extraction.zipfile.ZipFile", wraps=zipfile.ZipFile
+    ) as zip_cls:
+      extract_jar_source(str(source_jar), str(target))
+
+    zip_cls.assert_called_once()
+    raw = zip_cls.call_args.args[0]
+    assert isinstance(raw, io.BufferedReader)
+    assert raw.closed
+    assert (target / "com" / "example" / "Test.java").exists()
+
+  def test_extract_jar_source_stays_in_target(self, temp_dir: Path) -> None:
+    """Test entry names cannot escape the target directory."""
+    jar_path = temp_dir / "evil.jar"
+    with zipfile.ZipFile(jar_path, "w") as jar_zip:
+      jar_zip.writestr("../../Escape.java", "class Escape {}")
+      jar_zip.writestr("/abs/Abs.java", "class Abs {}")
+    target_dir = temp_dir / "extracted"
+
+    extract_jar_source(str(jar_path), str(target_dir))
+
+    assert (target_dir / "Escape.java").exists()
+    assert (target_dir / "abs" / "Abs.java").exists()
+    assert not (temp_dir.parent / "Escape.java").exists()
+
+  def test_extract_jar_source_parallel(self, temp_dir: Path) -> None:
+    """Test parallel extraction of many entries matches serial extraction."""
+    jar_path = temp_dir / "many.jar"
+    with zipfile.ZipFile(jar_path, "w", zipfile.ZIP_DEFLATED) as jar_zip:
+      for i in range(1000):
+        jar_zip.writestr(
+          f"com/example/p{i % 10}/Test{i}.java", f"public class Test{i} {{}}\n" * 20
+        )
+    serial_dir = temp_dir / "serial"
+    parallel_dir = temp_dir / "parallel"
+
+    extract_jar_source(str(jar_path), str(serial_dir))
+    extract_jar_source(str(jar_path), str(parallel_dir), parallel=True)
+
+    serial_files = sorted(p.relative_to(serial_dir) for p in serial_dir.rglob("*.java"))
+    parallel_files = sorted(
+      p.relative_to(parallel_dir) for p in parallel_dir.rglob("*.java")
+    )
+    assert len(parallel_files) == 1000
+    assert parallel_files == serial_files
+    for relative in serial_files:
+      assert (parallel_dir / relative).read_bytes() == (
+        serial_dir / relative
+      ).read_bytes()
+
+  def test_extract_jar_source_parallel_large_and_stored_entries(
+    self, temp_dir: Path
+  ) -> None:
+    """Test parallel extraction of stored and multi-chunk deflated entries."""
+    jar_path = temp_dir / "mixed.jar"
+    large = os.urandom(1024) * 2048
+    with zipfile.ZipFile(jar_path, "w") as jar_zip:
+      jar_zip.writestr("Stored.java", "class Stored {}", zipfile.ZIP_STORED)
+      jar_zip.writestr("Large.java", large, zipfile.ZIP_DEFLATED)
+    target_dir = temp_dir / "extracted"
+
+    extract_jar_source(str(jar_path), str(target_dir), parallel=True)
+
+    assert (target_dir / "Stored.java").read_text() == "class Stored {}"
+    assert (target_dir / "Large.java").read_bytes() == large
+
+  def test_extract_jar_source_parallel_bad_crc(self, temp_dir: Path) -> None:
+    """Test parallel extraction rejects entries whose data fails the CRC."""
+    jar_path = temp_dir / "corrupt.jar"
+    with zipfile.ZipFile(jar_path, "w") as jar_zip:
+      jar_zip.writestr("Test.java", "class Test {}", zipfile.ZIP_STORED)
+    jar_path.write_bytes(jar_path.read_bytes().replace(b"class Test", b"class Best"))
+
+    with pytest.raises(zipfile.BadZipFile, match="Bad CRC-32"):
+      extract_jar_source(str(jar_path), str(temp_dir / "extracted"), parallel=True)
+
+  def test_extract_jar_source_parallel_bad_local_header(self, temp_dir: Path) -> None:
+    """Test parallel extraction rejects an entry whose local header is damaged."""
+    jar_path = temp_dir / "corrupt.jar"
+    with zipfile.ZipFile(jar_path, "w") as jar_zip:
+      jar_zip.writestr("Test.java", "class Test {}")
+    data = jar_path.read_bytes()
+    jar_path.write_bytes(b"XX" + data[2:])
+
+    with pytest.raises(zipfile.BadZipFile, match="Bad magic number"):
+      extract_jar_source(str(jar_path), str(temp_dir / "extracted"), parallel=True)
+
+  def test_extract_jar_source_parallel_falls_back_for_other_methods(
+    self, temp_dir: Path
+  ) -> None:
+    """Test entries zlib cannot decode go through per-worker ZipFile handles."""
+    jar_path = temp_dir / "bzip2.jar"
+    with zipfile.ZipFile(jar_path, "w", zipfile.ZIP_BZIP2) as jar_zip:
+      jar_zip.writestr("Test.java", "class Test {}")
+    target_dir = temp_dir / "extracted"
+
+    with patch("src.utils.source_extraction._inflate_entries") as mock_inflate:
+      extract_jar_source(str(jar_path), str(target_dir), parallel=True)
+
+    mock_inflate.assert_not_called()
+    assert (target_dir / "Test.java").read_text() == "class Test {}"
+
   def test_extract_jar_source_nonexistent_jar(self, temp_dir: Path) -> None:
     """Test extraction with nonexistent JAR."""
     nonexistent_jar = temp_dir / "nonexistent.jar"
@@ -74,24 +271,13 @@ class TestExtractJarSource:
 class TestCopyDirectorySource:
   """Test copy_directory_source function."""
 
-  @pytest.fixture
-  def temp_dir(self) -> Iterator[Path]:
-    """Create temporary directory for tests."""
-    with tempfile.TemporaryDirectory() as tmp_dir:
-      yield Path(tmp_dir)
-
-  def test_copy_directory_source_success(self, temp_dir: Path) -> None:
+  def test_copy_directory_source_success(
+    self, temp_dir: Path, source_tree: Path
+  ) -> None:
     """Test successful directory copy."""
-    source_dir = temp_dir / "source"
     target_dir = temp_dir / "target"
 
-    # Create source structure
-    source_dir.mkdir()
-    (source_dir / "file1.txt").write_text("content1")
-    (source_dir / "subdir").mkdir()
-    (source_dir / "subdir" / "file2.txt").write_text("content2")
-
-    copy_directory_source(str(source_dir), str(target_dir))
+    copy_directory_source(str(source_tree), str(target_dir))
 
     assert target_dir.exists()
     assert (target_dir / "file1.txt").read_text() == "content1"
@@ -118,12 +304,6 @@ class TestCopyDirectorySource:
 class TestSafeCopyFile:
   """Test safe_copy_file function."""
 
-  @pytest.fixture
-  def temp_dir(self) -> Iterator[Path]:
-    """Create temporary directory for tests."""
-    with tempfile.TemporaryDirectory() as tmp_dir:
-      yield Path(tmp_dir)
-
   def test_safe_copy_file_success(self, temp_dir: Path) -> None:
     """Test successful file copy."""
     source_file = temp_dir / "source.txt"
@@ -139,6 +319,65 @@ class TestSafeCopyFile:
     assert target_file.exists()
     assert target_file.read_text() == test_content
 
+  def test_safe_copy_file_preserves_metadata(self, temp_dir: Path) -> None:
+    """Test copy keeps the source modification time and mode."""
+    source_file = temp_dir / "source.jar"
+    target_file = temp_dir / "target.jar"
+
+    source_file.write_bytes(b"PK\x03\x04" + b"\x00" * 1024)
+    source_file.chmod(0o640)
+    os.utime(source_file, (1_000_000_000, 1_000_000_000))
+
+    safe_copy_file(source_file, target_file)
+
+    assert target_file.read_bytes() == source_file.read_bytes()
+    assert target_file.stat().st_mtime == 1_000_000_000
+    assert target_file.stat().st_mode == source_file.stat().st_mode
+
+  def test_safe_copy_file_falls_back_to_sendfile(self, temp_dir: Path) -> None:
+    """Test copy falls back to os.sendfile when copy_file_range fails."""
+    source_file = temp_dir / "source.txt"
+    target_file = temp_dir / "target.txt"
+    source_file.write_text("test content")
+    os.utime(source_file, (1_000_000_000, 1_000_000_000))
+
+    with (
+      patch(
+        "src.utils.source_extraction.os.copy_file_range",
+        side_effect=OSError("not supported"),
+      ),
+      patch(
+        "src.utils.source_extraction.os.sendfile", wraps=os.sendfile
+      ) as mock_sendfile,
+    ):
+      result = safe_copy_file(source_file, target_file)
+
+    assert result["status"] == "success"
+    assert target_file.read_text() == "test content"
+    assert target_file.stat().st_mtime == 1_000_000_000
+    mock_sendfile.assert_called()
+
+  def test_safe_copy_file_falls_back_to_buffered_copy(self, temp_dir: Path) -> None:
+    """Test copy still succeeds when neither kernel copy is available."""
+    source_file = temp_dir / "source.txt"
+    target_file = temp_dir / "target.txt"
+    source_file.write_text("test content")
+
+    with (
+      patch(
+        "src.utils.source_extraction.os.copy_file_range",
+        side_effect=OSError("not supported"),
+      ),
+      patch(
+        "src.utils.source_extraction.os.sendfile",
+        side_effect=OSError("not supported"),
+      ),
+    ):
+      result = safe_copy_file(source_file, target_file)
+
+    assert result["status"] == "success"
+    assert target_file.read_text() == "test content"
+
   def test_safe_copy_file_nonexistent_source(self, temp_dir: Path) -> None:
     """Test copy with nonexistent source file."""
     source_file = temp_dir / "nonexistent.txt"
@@ -179,17 +418,66 @@ class TestSafeCopyFile:
 
     assert result["status"] == "success"
     assert target_file.read_text() == "source content"
+    assert sorted(p.name for p in temp_dir.iterdir()) == ["source.txt", "target.txt"]
+
+  def test_safe_copy_file_overwrite_replaces_atomically(self, temp_dir: Path) -> None:
+    """Test overwrites rename a temporary copy over the target."""
+    source_file = temp_dir / "source.txt"
+    target_file = temp_dir / "target.txt"
+    source_file.write_text("source content")
+    target_file.write_text("target content")
+
+    with patch(
+      "src.utils.source_extraction.os.replace", wraps=os.replace
+    ) as mock_replace:
+      safe_copy_file(source_file, target_file, overwrite=True)
+
+    mock_replace.assert_called_once()
+    temp_path, replaced = mock_replace.call_args.args
+    assert replaced == Path(os.path.realpath(target_file))
+    assert temp_path.parent == replaced.parent
+    assert temp_path != replaced
+    assert not temp_path.exists()
+    assert target_file.read_text() == "source content"
+
+  def test_safe_copy_file_overwrite_through_symlink(self, temp_dir: Path) -> None:
+    """Test overwriting a symlinked target updates the file it points at."""
+    source_file = temp_dir / "source.txt"
+    real_file = temp_dir / "real" / "target.txt"
+    link_file = temp_dir / "link.txt"
+    source_file.write_text("source content")
+    real_file.parent.mkdir()
+    real_file.write_text("target content")
+    link_file.symlink_to(real_file)
+
+    safe_copy_file(source_file, link_file, overwrite=True)
+
+    assert link_file.is_symlink()
+    assert real_file.read_text() == "source content"
+    assert sorted(p.name for p in real_file.parent.iterdir()) == ["target.txt"]
+
+  def test_safe_copy_file_overwrite_failure_keeps_target(self, temp_dir: Path) -> None:
+    """Test a failed overwrite leaves the existing target intact."""
+    source_file = temp_dir / "source.txt"
+    target_file = temp_dir / "target.txt"
+    source_file.write_text("source content")
+    target_file.write_text("target content")
+
+    with (
+      patch(
+        "src.utils.source_extraction._copy_file_in_kernel",
+        side_effect=OSError("disk full"),
+      ),
+      pytest.raises(OSError, match="disk full"),
+    ):
+      safe_copy_file(source_file, target_file, overwrite=True)
+
+    assert target_file.read_text() == "target content"
 
 
 class TestSafeSymlink:
   """Test safe_symlink function."""
 
-  @pytest.fixture
-  def temp_dir(self) -> Iterator[Path]:
-    """Create temporary directory for tests."""
-    with tempfile.TemporaryDirectory() as tmp_dir:
-      yield Path(tmp_dir)
-
   def test_safe_symlink_success(self, temp_dir: Path) -> None:
     """Test successful symlink creation."""
     source_file = temp_dir / "source.txt"
@@ -240,24 +528,11 @@ class TestSafeSymlink:
 class TestSafeCopyTree:
   """Test safe_copy_tree function."""
 
-  @pytest.fixture
-  def temp_dir(self) -> Iterator[Path]:
-    """Create temporary directory for tests."""
-    with tempfile.TemporaryDirectory() as tmp_dir:
-      yield Path(tmp_dir)
-
-  def test_safe_copy_tree_success(self, temp_dir: Path) -> None:
+  def test_safe_copy_tree_success(self, temp_dir: Path, source_tree: Path) -> None:
     """Test successful directory tree copy."""
-    source_dir = temp_dir / "source"
     target_dir = temp_dir / "target"
 
-    # Create source structure
-    source_dir.mkdir()
-    (source_dir / "file1.txt").write_text("content1")
-    (source_dir / "subdir").mkdir()
-    (source_dir / "subdir" / "file2.txt").write_text("content2")
-
-    result = safe_copy_tree(source_dir, target_dir)
+    result = safe_copy_tree(source_tree, target_dir)
 
     assert result["status"] == "success"
     assert result["operation"] == "copy_tree"
@@ -266,6 +541,52 @@ class TestSafeCopyTree:
     assert (target_dir / "file1.txt").read_text() == "content1"
     assert (target_dir / "subdir" / "file2.txt").read_text() == "content2"
 
+  def test_safe_copy_tree_many_files(self, temp_dir: Path) -> None:
+    """Test concurrent copy counts and copies every file."""
+    source_dir = temp_dir / "source"
+    target_dir = temp_dir / "target"
+
+    for i in range(5):
+      package_dir = source_dir / f"pkg{i}"
+      package_dir.mkdir(parents=True)
+      for j in range(20):
+        (package_dir / f"File{j}.java").write_text(f"class File{j} {{}}")
+
+    result = safe_copy_tree(source_dir, target_dir, workers=4)
+
+    assert result["copied_files"] == 100
+    assert result["copied_directories"] == 5
+    assert (target_dir / "pkg4" / "File19.java").read_text() == "class File19 {}"
+
+  def test_safe_copy_tree_nested(self, temp_dir: Path) -> None:
+    """Test nested and empty directories are counted and copied."""
+    source_dir = temp_dir / "source"
+    (source_dir / "a" / "b" / "c").mkdir(parents=True)
+    (source_dir / "empty").mkdir()
+    (source_dir / "a" / "b" / "c" / "Deep.java").write_bytes(b"x" * 100_000)
+    target_dir = temp_dir / "nested" / "target"
+
+    result = safe_copy_tree(source_dir, target_dir)
+
+    assert result["copied_files"] == 1
+    assert result["copied_directories"] == 4
+    assert (target_dir / "empty").is_dir()
+    assert (target_dir / "a" / "b" / "c" / "Deep.java").read_bytes() == b"x" * 100_000
+
+  @pytest.mark.skipif(not hasattr(os, "mkfifo"), reason="FIFOs are not supported")
+  def test_safe_copy_tree_rejects_fifo(self, temp_dir: Path) -> None:
+    """Test a FIFO in the source fails the copy instead of blocking on it."""
+    source_dir = temp_dir / "source"
+    source_dir.mkdir()
+    (source_dir / "Test.java").write_text("class Test {}")
+    os.mkfifo(source_dir / "pipe")
+    target_dir = temp_dir / "target"
+
+    with pytest.raises(OSError, match="is not a regular file"):
+      safe_copy_tree(source_dir, target_dir)
+
+    assert not target_dir.exists()
+
   def test_safe_copy_tree_nonexistent_source(self, temp_dir: Path) -> None:
     """Test copy tree with nonexistent source."""
     source_dir = temp_dir / "nonexistent"
@@ -289,12 +610,6 @@ class TestSafeCopyTree:
 class TestGitFunctions:
   """Test Git-related functions with mocks."""
 
-  @pytest.fixture
-  def temp_dir(self) -> Iterator[Path]:
-    """Create temporary directory for tests."""
-    with tempfile.TemporaryDirectory() as tmp_dir:
-      yield Path(tmp_dir)
-
   def test_compress_directory_to_7z_success(self, temp_dir: Path) -> None:
     """Test 7z compression success."""
     from src.utils.source_extraction import compress_directory_to_7z
@@ -313,6 +628,37 @@ class TestGitFunctions:
     assert target_7z.exists()
     assert target_7z.stat().st_size > 0
 
+  def test_compress_directory_to_7z_uses_plain_lzma2(self, temp_dir: Path) -> None:
+    """Test archives are written with LZMA2 only, without the BCJ filter."""
+    import py7zr
+
+    from src.utils.source_extraction import compress_directory_to_7z
+
+    source_dir = temp_dir / "source"
+    source_dir.mkdir()
+    (source_dir / "Test.java").write_text("public class Test {}\n" * 100)
+    target_7z = temp_dir / "archive.7z"
+
+    compress_directory_to_7z(str(source_dir), str(target_7z))
+
+    with py7zr.SevenZipFile(target_7z, mode="r") as archive:
+      assert archive.archiveinfo().method_names == ["LZMA2"]
+
+  def test_compress_directory_to_7z_relative_names(
+    self, temp_dir: Path, source_tree: Path
+  ) -> None:
+    """Test archived files are named relative to the source directory."""
+    import py7zr
+
+    from src.utils.source_extraction import compress_directory_to_7z
+
+    target_7z = temp_dir / "archive.7z"
+
+    compress_directory_to_7z(str(source_tree), str(target_7z))
+
+    with py7zr.SevenZipFile(target_7z, mode="r") as archive:
+      assert sorted(archive.getnames()) == ["file1.txt", "subdir/file2.txt"]
+
   def test_extract_7z_source_success(self, temp_dir: Path) -> None:
     """Test 7z extraction success."""
     from src.utils.source_extraction import compress_directory_to_7z, extract_7z_source
@@ -358,9 +704,9 @@ class TestGitFunctions:
     with pytest.raises(FileNotFoundError, match="7z file does not exist"):
       extract_7z_source(str(nonexistent_archive), str(target_dir))
 
-  @patch("src.utils.source_extraction.git.Repo")
+  @patch("src.utils.source_extraction.subprocess.run")
   def test_create_git_worktree_success(
-    self, mock_repo_class: MagicMock, temp_dir: Path
+    self, mock_run: MagicMock, temp_dir: Path
   ) -> None:
     """Test Git worktree creation success."""
     from src.utils.source_extraction import create_git_worktree
@@ -371,22 +717,35 @@ class TestGitFunctions:
     target_dir = temp_dir / "worktree"
     git_ref = "main"
 
-    # Mock Git repo
-    mock_repo = Mock()
-    mock_repo_class.return_value = mock_repo
-    mock_repo.commit.return_value = Mock()  # Mock commit exists
+    # Mock git: ref exists and worktree add succeeds
+    mock_run.return_value = Mock(returncode=0, stderr="")
 
     create_git_worktree(str(bare_repo_path), str(target_dir), git_ref)
 
-    mock_repo.git.worktree.assert_called_once_with("add", str(target_dir), git_ref)
-
-  @patch("src.utils.source_extraction.git.Repo")
+    git_dir = ["git", "--git-dir", str(bare_repo_path)]
+    assert mock_run.call_args_list[0].args[0] == [
+      *git_dir,
+      "cat-file",
+      "-e",
+      "main^{commit}",
+    ]
+    assert mock_run.call_args_list[1].args[0] == [
+      *git_dir,
+      "worktree",
+      "add",
+      str(target_dir),
+      git_ref,
+    ]
+    for call in mock_run.call_args_list:
+      assert call.kwargs["env"]["LC_ALL"] == "C"
+      assert call.kwargs["timeout"] > 0
+
+  @patch("src.utils.source_extraction.subprocess.run")
   def test_create_git_worktree_ref_not_found(
-    self, mock_repo_class: MagicMock, temp_dir: Path
+    self, mock_run: MagicMock, temp_dir: Path
   ) -> None:
     """Test Git worktree creation with invalid ref."""
     from src.utils.source_extraction import create_git_worktree
-    from git import exc as git_exc
 
     bare_repo_path = temp_dir / "bare"
     bare_repo_path.mkdir()
@@ -394,10 +753,67 @@ class TestGitFunctions:
     target_dir = temp_dir / "worktree"
     git_ref = "nonexistent"
 
-    # Mock Git repo with bad name error
-    mock_repo = Mock()
-    mock_repo_class.return_value = mock_repo
-    mock_repo.commit.side_effect = git_exc.BadName()
+    # Mock git cat-file rejecting the ref
+    mock_run.return_value = Mock(
+      returncode=128, stderr="fatal: Not a valid object name nonexistent^{commit}"
+    )
 
     with pytest.raises(GitRefNotFoundError):
       create_git_worktree(str(bare_repo_path), str(target_dir), git_ref)
+
+    mock_run.assert_called_once()
+
+  @patch("src.utils.source_extraction.subprocess.run")
+  def test_create_git_worktree_timeout(
+    self, mock_run: MagicMock, temp_dir: Path
+  ) -> None:
+    """Test a git call that hangs is reported as a GitCommandError."""
+    from git.exc import GitCommandError
+
+    from src.utils.source_extraction import create_git_worktree
+
+    bare_repo_path = temp_dir / "bare"
+    bare_repo_path.mkdir()
+    mock_run.side_effect = subprocess.TimeoutExpired(cmd="git", timeout=300)
+
+    with pytest.raises(GitCommandError, match="timed out"):
+      create_git_worktree(str(bare_repo_path), str(temp_dir / "worktree"), "main")
+
+  @pytest.mark.skipif(shutil.which("git") is None, reason="git is not installed")
+  def test_create_git_worktree_real_repository(self, temp_dir: Path) -> None:
+    """Test worktree creation and ref validation against a real bare clone."""
+    from git.exc import InvalidGitRepositoryError
+
+    from src.utils.source_extraction import create_git_worktree
+
+    work_repo = temp_dir / "work"
+    bare_repo = temp_dir / "bare.git"
+    git_env = {
+      **os.environ,
+      "GIT_AUTHOR_NAME": "test",
+      "GIT_AUTHOR_EMAIL": "test@example.com",
+      "GIT_COMMITTER_NAME": "test",
+      "GIT_COMMITTER_EMAIL": "test@example.com",
+    }
+    subprocess.run(["git", "init", "-q", "-b", "main", str(work_repo)], check=True)
+    (work_repo / "Test.java").write_text("public class Test {}")
+    subprocess.run(["git", "-C", str(work_repo), "add", "."], check=True)
+    subprocess.run(
+      ["git", "-C", str(work_repo), "commit", "-q", "-m", "init"],
+      check=True,
+      env=git_env,
+    )
+    subprocess.run(
+      ["git", "clone", "-q", "--bare", str(work_repo), str(bare_repo)], check=True
+    )
+
+    create_git_worktree(str(bare_repo), str(temp_dir / "worktree"), "main")
+    assert (temp_dir / "worktree" / "Test.java").exists()
+
+    with pytest.raises(GitRefNotFoundError):
+      create_git_worktree(str(bare_repo), str(temp_dir / "missing"), "v9.9.9")
+
+    plain_dir = temp_dir / "plain"
+    plain_dir.mkdir()
+    with pytest.raises(InvalidGitRepositoryError):
+      create_git_worktree(str(plain_dir), str(temp_dir / "x"), "main")
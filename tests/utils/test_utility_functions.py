@@ -1,4 +1,4 @@
-"""Tests for utility functions from path_utils, artifact_utils, and filesystem_exploration modules."""
+"""Tests for utility functions from artifact_utils and filesystem_exploration modules."""
 
 import os
 import tempfile
@@ -7,7 +7,6 @@ from unittest.mock import patch
 
 import pytest
 
-from src.utils.path_utils import calculate_directory_depth, normalize_path
 from src.utils.artifact_utils import (
   get_artifact_code_path,
   get_registered_source_info,
@@ -17,57 +16,6 @@ from src.utils.artifact_utils import (
 from src.utils.filesystem_exploration import get_file_info
 
 
-class TestNormalizePath:
-  """Test normalize_path function."""
-
-  def test_normalize_path_basic(self) -> None:
-    """Test basic path normalization."""
-    path = normalize_path("./test/path")
-    assert os.path.isabs(path)
-    assert "test" in path
-    assert "path" in path
-
-  def test_normalize_path_empty(self) -> None:
-    """Test empty path raises error."""
-    with pytest.raises(ValueError, match="Path must be a non-empty string"):
-      normalize_path("")
-
-  def test_normalize_path_whitespace(self) -> None:
-    """Test whitespace-only path raises error."""
-    with pytest.raises(ValueError, match="Path cannot be empty or whitespace only"):
-      normalize_path("   ")
-
-  def test_normalize_path_not_string(self) -> None:
-    """Test non-string path raises error."""
-    with pytest.raises(ValueError, match="Path must be a non-empty string"):
-      normalize_path(None)  # type: ignore
-
-
-class TestCalculateDirectoryDepth:
-  """Test calculate_directory_depth function."""
-
-  def test_calculate_directory_depth_same(self) -> None:
-    """Test depth calculation for same directory."""
-    base = "/home/user"
-    target = "/home/user"
-    depth = calculate_directory_depth(base, target)
-    assert depth == 0
-
-  def test_calculate_directory_depth_subdirectory(self) -> None:
-    """Test depth calculation for subdirectory."""
-    base = "/home/user"
-    target = "/home/user/project/src"
-    depth = calculate_directory_depth(base, target)
-    assert depth == 2
-
-  def test_calculate_directory_depth_not_under_base(self) -> None:
-    """Test error when target is not under base."""
-    base = "/home/user/project"
-    target = "/home/other"
-    with pytest.raises(ValueError, match="Target path is not under base path"):
-      calculate_directory_depth(base, target)
-
-
 class TestGetArtifactCodePath:
   """Test get_artifact_code_path function."""
 